@@ -0,0 +1,250 @@
+"""
+A module implementing an end-to-end benchmark suite.
+"""
+
+# built-in
+from contextlib import contextmanager
+from csv import writer
+from logging import getLogger
+from pathlib import Path
+from platform import python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+from typing import Any, Iterable, Iterator
+
+# third-party
+from vcorelib.paths import find_file
+
+# internal
+from ifgen import PKG_NAME, VERSION
+from ifgen.bench.synthetic import SyntheticSpec, write_synthetic
+from ifgen.config import load
+from ifgen.generation import generate
+from ifgen.svd import DEFAULT_SVD_CONFIG, register_processors, svd_config
+from ifgen.svd.backend import resolve_backend
+from ifgen.svd.task import SvdProcessingTask
+
+LOG = getLogger(__name__)
+
+PHASES = ["svd", "generate_configs", "config.load", "generate"]
+PhaseResults = dict[str, dict[str, float]]
+
+
+def packaged_svds() -> list[Path]:
+    """Get all SVD files bundled with this package."""
+
+    directory = find_file("svd", package=PKG_NAME)
+    assert directory is not None
+    return sorted(directory.glob("*.svd"))
+
+
+@contextmanager
+def measure(results: PhaseResults, name: str, memory: bool) -> Iterator[None]:
+    """Measure a phase's duration (or its peak traced memory)."""
+
+    if memory:
+        tracemalloc.start()
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+
+        result = results.setdefault(name, {})
+        if memory:
+            result["peak"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            result["time"] = elapsed
+
+
+def benchmark_pass(
+    path: Path,
+    output: Path,
+    memory: bool,
+    min_enum_width: int,
+    jobs: int,
+    backend: str,
+) -> PhaseResults:
+    """Run every phase of the pipeline, once, for a single SVD file."""
+
+    results: PhaseResults = {}
+    config = svd_config(path, DEFAULT_SVD_CONFIG)
+
+    with measure(results, "svd", memory):
+        task = SvdProcessingTask.svd(path, min_enum_width, backend=backend)
+
+    with measure(results, "generate_configs", memory):
+        task.generate_configs(output, config, jobs=jobs)
+
+    with measure(results, "config.load", memory):
+        ifgen_config = load(
+            output.joinpath(f"{PKG_NAME}.yaml"), cache=False, jobs=jobs
+        )
+
+    with measure(results, "generate", memory):
+        generate(output, ifgen_config, force=True, jobs=jobs)
+
+    return results
+
+
+def benchmark_svd(
+    path: Path,
+    repeat: int = 1,
+    memory: bool = True,
+    min_enum_width: int = 2,
+    jobs: int = 1,
+    backend: str = "auto",
+) -> PhaseResults:
+    """
+    Benchmark a single SVD file. Times are the best of 'repeat' passes, peak
+    memory is measured with an additional (traced) pass.
+    """
+
+    result: PhaseResults = {name: {} for name in PHASES}
+
+    for traced in [False] * repeat + ([True] if memory else []):
+        with TemporaryDirectory() as tmpdir:
+            results = benchmark_pass(
+                path, Path(tmpdir), traced, min_enum_width, jobs, backend
+            )
+
+        for name, values in results.items():
+            for key, value in values.items():
+                result[name][key] = min(value, result[name].get(key, value))
+
+    return result
+
+
+def run_benchmarks(
+    paths: Iterable[Path],
+    repeat: int = 1,
+    memory: bool = True,
+    min_enum_width: int = 2,
+    jobs: int = 1,
+    backend: str = "auto",
+) -> dict[str, Any]:
+    """Benchmark SVD files."""
+
+    register_processors()
+
+    results: dict[str, PhaseResults] = {}
+    for path in paths:
+        LOG.info("Benchmarking '%s'.", path)
+        results[path.with_suffix("").name] = benchmark_svd(
+            path,
+            repeat=repeat,
+            memory=memory,
+            min_enum_width=min_enum_width,
+            jobs=jobs,
+            backend=backend,
+        )
+
+    return {
+        "version": VERSION,
+        "python": python_version(),
+        "backend": resolve_backend(backend),
+        "results": results,
+    }
+
+
+def run_scaling(
+    parameter: str,
+    values: Iterable[int],
+    repeat: int = 1,
+    memory: bool = True,
+    min_enum_width: int = 2,
+    jobs: int = 1,
+    backend: str = "auto",
+) -> dict[str, Any]:
+    """
+    Benchmark synthetic SVD files, varying a single synthetic-device parameter
+    (to produce scaling curves).
+    """
+
+    register_processors()
+
+    results: dict[str, PhaseResults] = {}
+    totals: dict[str, dict[str, int]] = {}
+
+    with TemporaryDirectory() as tmpdir:
+        for value in values:
+            spec = SyntheticSpec(**{parameter: value})
+            LOG.info("Benchmarking %s=%d (%s).", parameter, value, spec.totals)
+
+            path = write_synthetic(spec, Path(tmpdir), config=False)[0]
+            results[str(value)] = benchmark_svd(
+                path,
+                repeat=repeat,
+                memory=memory,
+                min_enum_width=min_enum_width,
+                jobs=jobs,
+                backend=backend,
+            )
+            totals[str(value)] = spec.totals
+
+    return {
+        "version": VERSION,
+        "python": python_version(),
+        "backend": resolve_backend(backend),
+        "parameter": parameter,
+        "totals": totals,
+        "results": results,
+    }
+
+
+def write_csv(path: Path, result: dict[str, Any]) -> None:
+    """
+    Write benchmark results as CSV rows (one per measurement), suitable for
+    plotting.
+    """
+
+    with path.open("w", encoding="utf-8", newline="") as path_fd:
+        csv = writer(path_fd)
+        csv.writerow(
+            [result.get("parameter", "name"), "phase", "metric", "value"]
+        )
+
+        for name, phases in result["results"].items():
+            for phase, values in phases.items():
+                for metric, value in values.items():
+                    csv.writerow([name, phase, metric, value])
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Compare benchmark results with a baseline. Returns a description of each
+    measurement that regressed by more than a threshold (a fraction of the
+    baseline value).
+    """
+
+    regressions = []
+
+    for device, phases in current["results"].items():
+        for name, values in phases.items():
+            base = baseline["results"].get(device, {}).get(name, {})
+
+            for key, value in values.items():
+                if key not in base:
+                    continue
+
+                limit = base[key] * (1.0 + threshold)
+                LOG.info(
+                    "%s %s %s: %s (baseline: %s).",
+                    device,
+                    name,
+                    key,
+                    value,
+                    base[key],
+                )
+                if value > limit:
+                    regressions.append(
+                        f"{device} {name} {key}: {value} > {limit} "
+                        f"(baseline {base[key]} + {threshold:.0%})"
+                    )
+
+    return regressions
@@ -0,0 +1,441 @@
+"""
+A module for generating synthetic (parameterized) SVD files and ifgen
+configurations, for scale testing.
+"""
+
+# built-in
+from dataclasses import asdict, dataclass
+from itertools import count
+from pathlib import Path
+from typing import Any, Iterator
+from xml.etree import ElementTree
+
+# third-party
+from vcorelib.io import ARBITER
+
+# internal
+from ifgen import PKG_NAME
+
+BASE_ADDRESS = 0x40000000
+REGISTER_SIZE = 4
+REGISTER_BITS = REGISTER_SIZE * 8
+MAX_FIELD_WIDTH = 8
+ENUM_VALUES = 4
+CLUSTER_DIM = 2
+CLUSTER_REGISTERS = 4
+DEVICE_NAME = "SYNTH"
+
+PARAMETERS = {
+    "peripherals": "base (non-derived) peripherals",
+    "registers": "registers per peripheral",
+    "fields": "bit-fields per register",
+    "enums": "enumerated bit-fields per register",
+    "distinct_enums": (
+        "number of distinct enumerations that enumerated bit-fields cycle "
+        "through (0: every enumeration is distinct)"
+    ),
+    "clusters": "clusters (register-array structs) per peripheral",
+    "alternates": "registers, per peripheral, that have an alternate",
+    "derived": "peripherals derived from base peripherals (in total)",
+}
+
+
+@dataclass
+class SyntheticSpec:
+    """Parameters controlling the size and shape of a synthetic device."""
+
+    peripherals: int = 8
+    registers: int = 16
+    fields: int = 4
+    enums: int = 1
+    distinct_enums: int = 0
+    clusters: int = 1
+    alternates: int = 1
+    derived: int = 2
+
+    def __post_init__(self) -> None:
+        """Validate this specification."""
+
+        for name in PARAMETERS:
+            assert getattr(self, name) >= 0, name
+
+        assert self.peripherals >= 1
+        assert 1 <= self.fields <= REGISTER_BITS, self.fields
+        assert self.enums <= self.fields, (self.enums, self.fields)
+        assert self.alternates <= self.registers, (
+            self.alternates,
+            self.registers,
+        )
+
+    @property
+    def field_width(self) -> int:
+        """The width of every bit-field."""
+        return min(REGISTER_BITS // self.fields, MAX_FIELD_WIDTH)
+
+    @property
+    def enum_values(self) -> int:
+        """The number of values in each enumeration."""
+        return min(1 << self.field_width, ENUM_VALUES)
+
+    @property
+    def cluster_size(self) -> int:
+        """The size of a single cluster element (in bytes)."""
+        return CLUSTER_REGISTERS * REGISTER_SIZE
+
+    @property
+    def peripheral_size(self) -> int:
+        """The size of a peripheral's register block (in bytes)."""
+
+        return REGISTER_SIZE * self.registers + (
+            self.clusters * CLUSTER_DIM * self.cluster_size
+        )
+
+    @property
+    def peripheral_stride(self) -> int:
+        """The address distance between peripherals."""
+
+        stride = 0x1000
+        while stride < self.peripheral_size:
+            stride *= 2
+        return stride
+
+    def address(self, index: int) -> str:
+        """Get the base address of the peripheral at some index."""
+        return hex(BASE_ADDRESS + index * self.peripheral_stride)
+
+    def peripheral_names(self) -> list[str]:
+        """Get the names of all base peripherals."""
+        return [f"P{idx}" for idx in range(self.peripherals)]
+
+    def derived_peripherals(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Get the name, base peripheral and root (non-derived) peripheral for
+        each derived peripheral. Once every base peripheral has a derivative,
+        peripherals are derived from previous derivatives (forming chains).
+        """
+
+        names = self.peripheral_names()
+        for idx in range(self.derived):
+            root = names[idx % len(names)]
+            level = idx // len(names)
+            base = root if level == 0 else f"{root}_D{level - 1}"
+            yield f"{root}_D{level}", base, root
+
+    def register_names(self) -> list[str]:
+        """Get the names of every (non-alternate) peripheral register."""
+        return [f"R{idx}" for idx in range(self.registers)]
+
+    def cluster_register_names(self) -> list[str]:
+        """Get the names of every cluster register."""
+        return [f"CR{idx}" for idx in range(CLUSTER_REGISTERS)]
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """Get aggregate counts for the device this specification produces."""
+
+        cluster_regs = self.clusters * CLUSTER_REGISTERS
+        registers = self.peripherals * (
+            self.registers + self.alternates + cluster_regs
+        )
+        return {
+            "peripherals": self.peripherals + self.derived,
+            "structs": self.peripherals * (1 + self.clusters),
+            "registers": registers,
+            "fields": registers * self.fields,
+            "enums": registers * self.enums,
+        }
+
+
+def enum_ids(spec: SyntheticSpec) -> Iterator[int]:
+    """Assign value-set indices to enumerated bit-fields (in order)."""
+
+    if spec.distinct_enums:
+        return (x % spec.distinct_enums for x in count())
+    return count()
+
+
+def _text(parent: ElementTree.Element, tag: str, text: Any) -> None:
+    """Add a child element with text content."""
+    ElementTree.SubElement(parent, tag).text = str(text)
+
+
+def _svd_register(
+    parent: ElementTree.Element,
+    spec: SyntheticSpec,
+    enums: Iterator[int],
+    name: str,
+    offset: int,
+    alternate: str = None,
+) -> None:
+    """Add a register element."""
+
+    register = ElementTree.SubElement(parent, "register")
+    _text(register, "name", name)
+    _text(register, "description", f"Synthetic register {name}")
+    if alternate is not None:
+        _text(register, "alternateRegister", alternate)
+    _text(register, "addressOffset", hex(offset))
+    _text(register, "size", REGISTER_BITS)
+    _text(register, "resetValue", "0x00000000")
+
+    elem = ElementTree.SubElement(register, "fields")
+    width = spec.field_width
+    for idx in range(spec.fields):
+        field = ElementTree.SubElement(elem, "field")
+        _text(field, "name", f"F{idx}")
+        _text(field, "description", f"Synthetic field {name}.F{idx}")
+        _text(field, "bitOffset", idx * (REGISTER_BITS // spec.fields))
+        _text(field, "bitWidth", width)
+        _text(field, "access", "read-write")
+
+        if idx < spec.enums:
+            values = ElementTree.SubElement(field, "enumeratedValues")
+            enum = next(enums)
+            for value in range(spec.enum_values):
+                item = ElementTree.SubElement(values, "enumeratedValue")
+                _text(item, "name", f"E{enum}_V{value}")
+                _text(item, "description", f"Value {value}")
+                _text(item, "value", value)
+
+
+def _svd_peripheral(
+    parent: ElementTree.Element,
+    spec: SyntheticSpec,
+    enums: Iterator[int],
+    name: str,
+    index: int,
+) -> None:
+    """Add a (base) peripheral element."""
+
+    peripheral = ElementTree.SubElement(parent, "peripheral")
+    _text(peripheral, "name", name)
+    _text(peripheral, "description", f"Synthetic peripheral {name}")
+    _text(peripheral, "groupName", name)
+    _text(peripheral, "baseAddress", spec.address(index))
+
+    block = ElementTree.SubElement(peripheral, "addressBlock")
+    _text(block, "offset", 0)
+    _text(block, "size", hex(spec.peripheral_size))
+    _text(block, "usage", "registers")
+
+    interrupt = ElementTree.SubElement(peripheral, "interrupt")
+    _text(interrupt, "name", f"{name}_IRQ")
+    _text(interrupt, "value", index)
+
+    registers = ElementTree.SubElement(peripheral, "registers")
+
+    offset = 0
+    for idx, reg in enumerate(spec.register_names()):
+        _svd_register(registers, spec, enums, reg, offset)
+        if idx < spec.alternates:
+            _svd_register(
+                registers, spec, enums, f"{reg}_ALT", offset, alternate=reg
+            )
+        offset += REGISTER_SIZE
+
+    for idx in range(spec.clusters):
+        cluster = ElementTree.SubElement(registers, "cluster")
+        _text(cluster, "dim", CLUSTER_DIM)
+        _text(cluster, "dimIncrement", hex(spec.cluster_size))
+        _text(cluster, "name", f"C{idx}[%s]")
+        _text(cluster, "description", f"Synthetic cluster {name}.C{idx}")
+        _text(cluster, "headerStructName", f"{name}_C{idx}")
+        _text(cluster, "addressOffset", hex(offset))
+
+        for reg_idx, reg in enumerate(spec.cluster_register_names()):
+            _svd_register(cluster, spec, enums, reg, reg_idx * REGISTER_SIZE)
+
+        offset += CLUSTER_DIM * spec.cluster_size
+
+
+def synthetic_svd(spec: SyntheticSpec) -> ElementTree.ElementTree:
+    """Create a synthetic CMSIS-SVD document."""
+
+    device = ElementTree.Element("device", schemaVersion="1.1")
+    _text(device, "name", DEVICE_NAME)
+    _text(device, "version", "1.0")
+    _text(device, "description", f"Synthetic device ({asdict(spec)})")
+
+    cpu = ElementTree.SubElement(device, "cpu")
+    for key, value in [
+        ("name", "CM4"),
+        ("revision", "r0p1"),
+        ("endian", "little"),
+        ("mpuPresent", "false"),
+        ("fpuPresent", "false"),
+        ("nvicPrioBits", 3),
+        ("vendorSystickConfig", "false"),
+    ]:
+        _text(cpu, key, value)
+
+    _text(device, "addressUnitBits", 8)
+    _text(device, "width", REGISTER_BITS)
+    _text(device, "size", REGISTER_BITS)
+    _text(device, "access", "read-write")
+
+    peripherals = ElementTree.SubElement(device, "peripherals")
+
+    enums = enum_ids(spec)
+    names = spec.peripheral_names()
+    for idx, name in enumerate(names):
+        _svd_peripheral(peripherals, spec, enums, name, idx)
+
+    for idx, (name, base, _) in enumerate(spec.derived_peripherals()):
+        peripheral = ElementTree.SubElement(
+            peripherals, "peripheral", derivedFrom=base
+        )
+        _text(peripheral, "name", name)
+        _text(peripheral, "baseAddress", spec.address(len(names) + idx))
+
+    ElementTree.indent(device)
+    return ElementTree.ElementTree(device)
+
+
+def _config_register(
+    spec: SyntheticSpec,
+    enums: Iterator[int],
+    enum_data: dict[str, Any],
+    name: str,
+) -> dict[str, Any]:
+    """Create configuration data for a register field."""
+
+    bit_fields = []
+    for idx in range(spec.fields):
+        field: dict[str, Any] = {
+            "name": f"F{idx}",
+            "description": f"Synthetic field {name}.F{idx}",
+            "index": idx * (REGISTER_BITS // spec.fields),
+            "width": spec.field_width,
+        }
+
+        if idx < spec.enums:
+            enum = f"E{next(enums)}"
+            field["type"] = enum
+            enum_data.setdefault(
+                enum,
+                {
+                    "enum": {
+                        f"V{value}": {"value": value}
+                        for value in range(spec.enum_values)
+                    }
+                },
+            )
+
+        bit_fields.append(field)
+
+    return {
+        "name": name,
+        "type": f"uint{REGISTER_BITS}_t",
+        "description": f"Synthetic register {name}",
+        "fields": bit_fields,
+    }
+
+
+def synthetic_config(spec: SyntheticSpec) -> dict[str, Any]:
+    """
+    Create a synthetic ifgen configuration (equivalent to the configuration
+    that processing the synthetic SVD produces, as a single file).
+    """
+
+    structs: dict[str, Any] = {}
+    enum_data: dict[str, Any] = {}
+    enums = enum_ids(spec)
+
+    instances: dict[str, list[dict[str, Any]]] = {}
+    names = spec.peripheral_names()
+    for idx, name in enumerate(names):
+        instances[name] = [{"name": name, "address": spec.address(idx)}]
+    for idx, (name, _, root) in enumerate(spec.derived_peripherals()):
+        instances[root].append(
+            {"name": name, "address": spec.address(len(names) + idx)}
+        )
+
+    for name in names:
+        struct_fields = []
+
+        offset = 0
+        for idx, reg in enumerate(spec.register_names()):
+            field = _config_register(spec, enums, enum_data, reg)
+            field["expected_offset"] = offset
+            if idx < spec.alternates:
+                alternate = _config_register(
+                    spec, enums, enum_data, f"{reg}_ALT"
+                )
+                del alternate["type"]
+                field["alternates"] = [alternate]
+
+            struct_fields.append(field)
+            offset += REGISTER_SIZE
+
+        for idx in range(spec.clusters):
+            cluster = f"{name}_C{idx}"
+            structs[cluster] = {
+                "expected_size": spec.cluster_size,
+                "fields": [
+                    _config_register(spec, enums, enum_data, reg)
+                    for reg in spec.cluster_register_names()
+                ],
+            }
+            struct_fields.append(
+                {
+                    "name": f"C{idx}",
+                    "type": cluster,
+                    "array_length": CLUSTER_DIM,
+                    "expected_offset": offset,
+                }
+            )
+            offset += CLUSTER_DIM * spec.cluster_size
+
+        structs[name] = {
+            "description": f"Synthetic peripheral {name}",
+            "instances": instances[name],
+            "expected_size": offset,
+            "fields": struct_fields,
+        }
+
+    return {
+        "namespace": [DEVICE_NAME],
+        "struct": {
+            "stream": False,
+            "codec": False,
+            "methods": False,
+            "unit_test": False,
+            "identifier": False,
+        },
+        "enum": {"use_map": False, "identifier": False},
+        "structs": structs,
+        "enums": enum_data,
+    }
+
+
+def write_synthetic(
+    spec: SyntheticSpec,
+    output: Path,
+    svd: bool = True,
+    config: bool = True,
+    config_suffix: str = ".yaml",
+) -> list[Path]:
+    """
+    Write a synthetic SVD file and/or configuration to an output directory.
+    """
+
+    output.mkdir(parents=True, exist_ok=True)
+
+    written = []
+
+    if svd:
+        path = output.joinpath(f"{DEVICE_NAME}.svd")
+        synthetic_svd(spec).write(path, encoding="utf-8", xml_declaration=True)
+        written.append(path)
+
+    if config:
+        path = output.joinpath(PKG_NAME).with_suffix(config_suffix)
+        # Structs must be declared before the structs that use them.
+        options: dict[str, Any] = {}
+        if config_suffix == ".json":
+            options["sort_keys"] = False
+
+        ARBITER.encode(path, synthetic_config(spec), **options)
+        written.append(path)
+
+    return written
@@ -0,0 +1,82 @@
+"""
+A module implementing interfaces for binary (pickled) cache entries.
+"""
+
+# built-in
+from contextlib import suppress
+import gc
+from hashlib import file_digest
+from logging import getLogger
+from pathlib import Path
+import pickle
+from typing import Any, Iterable, Optional
+import zlib
+
+# internal
+from ifgen.paths import write_atomic
+
+LOG = getLogger(__name__)
+
+# Errors that indicate a cache entry can't be used (e.g. it was written by
+# an incompatible version of a dependency).
+LOAD_ERRORS = (
+    zlib.error,
+    pickle.UnpicklingError,
+    EOFError,
+    AttributeError,
+    ImportError,
+)
+
+
+def read_entry(path: Path, compressed: bool = False) -> Optional[Any]:
+    """
+    Load a cache entry (if one exists). Entries that can't be loaded are
+    discarded.
+    """
+
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    # Entries are large graphs of small objects, garbage collection passes
+    # while loading them only add time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(zlib.decompress(data) if compressed else data)
+    except LOAD_ERRORS as exc:
+        LOG.warning("Discarding cache entry '%s' (%s).", path, exc)
+        path.unlink(missing_ok=True)
+        return None
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def write_entry(path: Path, data: Any, compressed: bool = False) -> None:
+    """Write a cache entry."""
+
+    raw = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    if compressed:
+        raw = zlib.compress(raw, 1)
+
+    write_atomic(path, raw)
+
+
+def digest_file(path: Path) -> str:
+    """Get a digest of a file's contents."""
+
+    with path.open("rb") as path_fd:
+        return file_digest(path_fd, "blake2b").hexdigest()
+
+
+def file_digests(paths: Iterable[Path]) -> dict[str, str]:
+    """Get content digests for files (that exist)."""
+
+    result = {}
+    for path in paths:
+        with suppress(FileNotFoundError):
+            result[str(path)] = digest_file(path)
+
+    return result
@@ -0,0 +1,34 @@
+"""
+A module implementing a client for the generation server (importing as little
+as possible, so that requests start quickly).
+"""
+
+# built-in
+import json
+from pathlib import Path
+import socket
+from typing import Any
+
+# internal
+from ifgen.paths import cache_dir
+
+# Unix sockets aren't available on every platform (e.g. Windows).
+UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+
+def default_socket() -> Path:
+    """Get the default path to the generation server's socket."""
+    return cache_dir("server.sock")
+
+
+def send_request(path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    """Send a request to a generation server and return its response."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            response = stream.readline()
+
+    assert response, f"No response from server '{path}'."
+    return json.loads(response)  # type: ignore
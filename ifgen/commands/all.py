@@ -16,8 +16,12 @@ from typing import Tuple as _Tuple
 from vcorelib.args import CommandRegister as _CommandRegister
 
 # internal
+from ifgen.commands.bench import add_bench_cmd
+from ifgen.commands.client import add_client_cmd
 from ifgen.commands.gen import add_gen_cmd
+from ifgen.commands.serve import add_serve_cmd
 from ifgen.commands.svd import add_svd_cmd
+from ifgen.commands.synth import add_synth_cmd
 
 
 def commands() -> _List[_Tuple[str, str, _CommandRegister]]:
@@ -34,5 +38,25 @@ def commands() -> _List[_Tuple[str, str, _CommandRegister]]:
             "process CMSIS-SVD files",
             add_svd_cmd,
         ),
+        (
+            "bench",
+            "benchmark processing and generation",
+            add_bench_cmd,
+        ),
+        (
+            "synth",
+            "generate synthetic SVD files and configurations",
+            add_synth_cmd,
+        ),
+        (
+            "serve",
+            "keep configurations loaded and handle generation requests",
+            add_serve_cmd,
+        ),
+        (
+            "client",
+            "request generation from a server (like 'gen')",
+            add_client_cmd,
+        ),
         ("noop", "command stub (does nothing)", lambda _: lambda _: 0),
     ]
@@ -0,0 +1,86 @@
+"""
+A module implementing arguments shared by commands (without importing
+anything that generation needs).
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from pathlib import Path
+
+# internal
+from ifgen import PKG_NAME
+from ifgen.executors import EXECUTORS
+
+
+def add_generation_args(parser: _ArgumentParser) -> None:
+    """Add arguments for generating a project's outputs."""
+
+    parser.add_argument(
+        "--recursion",
+        type=int,
+        default=10000,
+        help="recursion limit to set (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=f"{PKG_NAME}.yaml",
+        help="configuration file to use (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "-e",
+        "--executor",
+        choices=EXECUTORS,
+        default="thread",
+        help=(
+            "run parallel generation jobs in threads or in worker "
+            "processes (default: '%(default)s')"
+        ),
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="ignore the build cache and regenerate all outputs",
+    )
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        help=(
+            "always load (and validate) configuration files, instead of "
+            "using a cached configuration when no loaded file changed"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help=(
+            "number of parallel configuration-loading and generation jobs "
+            "(default: CPU count)"
+        ),
+    )
+    parser.add_argument(
+        "-r",
+        "--root",
+        default=".",
+        help=(
+            "root directory to use for relative "
+            "paths (default: '%(default)s')"
+        ),
+    )
+
+
+def add_profile_args(parser: _ArgumentParser) -> None:
+    """Add profiling arguments to a command's parser."""
+
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help="write a JSON report of time spent in each phase to this path",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        help="write a cProfile (pstats) dump to this path",
+    )
@@ -0,0 +1,8 @@
+"""
+An entry-point for the 'bench' command (see 'commands.impl.bench').
+"""
+
+# internal
+from ifgen.commands.lazy import lazy_command
+
+add_bench_cmd = lazy_command("bench")
@@ -0,0 +1,105 @@
+"""
+An entry-point for the 'client' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from contextlib import suppress
+from logging import getLogger
+from pathlib import Path
+import sys
+from typing import Any
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+from vcorelib.paths import normalize
+
+# internal
+from ifgen import VERSION
+from ifgen.client import UNIX_SOCKETS, default_socket, send_request
+from ifgen.commands.args import add_generation_args, add_profile_args
+from ifgen.paths import combine_if_not_absolute
+
+LOG = getLogger(__name__)
+
+
+def client_cmd(args: _Namespace) -> int:
+    """Execute the client command."""
+
+    root = normalize(args.root).resolve()
+
+    request: dict[str, Any] = {"version": VERSION, "command": "stop"}
+    if not args.stop:
+        request.update(
+            {
+                "command": "gen",
+                "root": str(root),
+                "config": str(
+                    combine_if_not_absolute(root, args.config).resolve()
+                ),
+                "force": args.force,
+                "jobs": args.jobs,
+                "executor": args.executor,
+                "no_config_cache": args.no_config_cache,
+                "profile": (
+                    str(args.profile.resolve()) if args.profile else None
+                ),
+                "cprofile": (
+                    str(args.cprofile.resolve()) if args.cprofile else None
+                ),
+            }
+        )
+
+    response = None
+    if UNIX_SOCKETS:
+        with suppress(FileNotFoundError, ConnectionRefusedError):
+            response = send_request(args.socket, request)
+
+    if response is None:
+        if args.stop or args.no_fallback:
+            LOG.error("No server is listening on '%s'.", args.socket)
+            return 1
+
+        LOG.info("No server on '%s', generating in-process.", args.socket)
+
+        sys.setrecursionlimit(args.recursion)
+
+        # pylint: disable=import-outside-toplevel
+        from ifgen.server import handle_request
+
+        # Messages were already logged by this process.
+        return handle_request({}, request)["status"]  # type: ignore
+
+    if "error" in response:
+        LOG.error(response["error"])
+
+    for name, level, message in response["records"]:
+        getLogger(name).log(level, message)
+
+    return response["status"]  # type: ignore
+
+
+def add_client_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add client-command arguments to its parser."""
+
+    add_generation_args(parser)
+    add_profile_args(parser)
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=Path,
+        default=default_socket(),
+        help="server socket to connect to (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="fail (instead of generating in-process) if no server is running",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="stop the server",
+    )
+    return client_cmd
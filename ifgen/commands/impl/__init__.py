@@ -0,0 +1,3 @@
+"""
+Command implementations (each is only imported when its command is used).
+"""
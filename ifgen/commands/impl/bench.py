@@ -0,0 +1,167 @@
+"""
+An entry-point for the 'bench' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from logging import getLogger
+from pathlib import Path
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+from vcorelib.io import ARBITER
+from vcorelib.paths import find_file
+
+# internal
+from ifgen import PKG_NAME
+from ifgen.bench import (
+    compare,
+    packaged_svds,
+    run_benchmarks,
+    run_scaling,
+    write_csv,
+)
+from ifgen.bench.synthetic import PARAMETERS
+from ifgen.svd import DEFAULT_MIN_ENUM_WIDTH
+from ifgen.svd.backend import BACKENDS
+
+
+def bench_cmd(args: _Namespace) -> int:
+    """Execute the bench command."""
+
+    logger = getLogger(__name__)
+
+    options = {
+        "repeat": args.repeat,
+        "memory": not args.no_memory,
+        "min_enum_width": args.min_enum_width,
+        "jobs": args.jobs,
+        "backend": args.backend,
+    }
+
+    if args.scale is not None:
+        parameter, values = args.scale.split("=", maxsplit=1)
+        parameter = parameter.replace("-", "_")
+        assert parameter in PARAMETERS, f"Unknown parameter '{parameter}'!"
+
+        result = run_scaling(
+            parameter, [int(x) for x in values.split(",")], **options
+        )
+    else:
+        paths = []
+        for svd_file in args.svd_files:
+            path = find_file(
+                svd_file, package=PKG_NAME, logger=logger, include_cwd=True
+            )
+            assert path is not None, svd_file
+            paths.append(path)
+
+        result = run_benchmarks(paths or packaged_svds(), **options)
+
+    ARBITER.encode(args.output, result)
+    logger.info("Wrote results to '%s'.", args.output)
+
+    if args.csv is not None:
+        write_csv(args.csv, result)
+        logger.info("Wrote results to '%s'.", args.csv)
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(
+        ARBITER.decode(args.baseline, require_success=True).data,
+        result,
+        args.threshold,
+    )
+    for regression in regressions:
+        logger.error("Regression: %s.", regression)
+
+    return 1 if regressions else 0
+
+
+def add_bench_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add bench-command arguments to its parser."""
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default="bench.json",
+        help="file to write results to (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "--csv", type=Path, help="also write results (as CSV) to this path"
+    )
+    parser.add_argument(
+        "-s",
+        "--scale",
+        metavar="PARAM=V1,V2,...",
+        help=(
+            "benchmark synthetic devices (see 'synth') with one parameter "
+            "varied, instead of SVD files (parameters: "
+            f"{', '.join(PARAMETERS)})"
+        ),
+    )
+    parser.add_argument(
+        "-B",
+        "--baseline",
+        type=Path,
+        help="results to compare against (fail on regressions)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help=(
+            "allowed increase (as a fraction of the baseline) before a "
+            "measurement counts as a regression (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of timed passes, best is kept (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the (slower) traced pass that measures peak memory",
+    )
+    parser.add_argument(
+        "-m",
+        "--min-enum-width",
+        type=int,
+        default=DEFAULT_MIN_ENUM_WIDTH,
+        help=(
+            "minimum number of enumeration elements to warrant "
+            "generating an enumeration definition (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "number of parallel jobs for configuration encoding and "
+            "generation (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="XML parser to use (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "svd_files",
+        nargs="*",
+        help="paths/uris to CMSIS-SVD files (default: all packaged files)",
+    )
+
+    return bench_cmd
@@ -0,0 +1,50 @@
+"""
+An entry-point for the 'gen' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+import sys
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+from vcorelib.paths import normalize
+
+# internal
+from ifgen.commands.args import add_generation_args, add_profile_args
+from ifgen.config import load
+from ifgen.generation import generate
+from ifgen.paths import combine_if_not_absolute
+from ifgen.profile import profiling
+
+
+def gen_cmd(args: _Namespace) -> int:
+    """Execute the gen command."""
+
+    root = normalize(args.root)
+
+    sys.setrecursionlimit(args.recursion)
+
+    with profiling(args.profile, args.cprofile):
+        generate(
+            root.resolve(),
+            load(
+                combine_if_not_absolute(root, args.config),
+                cache=not args.no_config_cache,
+                jobs=args.jobs,
+            ),
+            force=args.force,
+            jobs=args.jobs,
+            executor=args.executor,
+        )
+
+    return 0
+
+
+def add_gen_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add gen-command arguments to its parser."""
+
+    add_generation_args(parser)
+    add_profile_args(parser)
+    return gen_cmd
@@ -0,0 +1,51 @@
+"""
+An entry-point for the 'serve' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from logging import getLogger
+from pathlib import Path
+import sys
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+
+# internal
+from ifgen.client import UNIX_SOCKETS, default_socket
+from ifgen.server import serve
+
+
+def serve_cmd(args: _Namespace) -> int:
+    """Execute the serve command."""
+
+    if not UNIX_SOCKETS:
+        getLogger(__name__).error(
+            "Unix sockets aren't available on this platform, use 'gen' "
+            "(or 'client', which generates in-process) instead."
+        )
+        return 1
+
+    sys.setrecursionlimit(args.recursion)
+    serve(args.socket)
+    return 0
+
+
+def add_serve_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add serve-command arguments to its parser."""
+
+    parser.add_argument(
+        "--recursion",
+        type=int,
+        default=10000,
+        help="recursion limit to set (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=Path,
+        default=default_socket(),
+        help="socket to listen on (default: '%(default)s')",
+    )
+    return serve_cmd
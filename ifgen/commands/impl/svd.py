@@ -0,0 +1,295 @@
+"""
+An entry-point for the 'svd' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from functools import partial
+from glob import glob
+from logging import getLogger
+from multiprocessing import Pool
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Optional
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+from vcorelib.io import ARBITER
+from vcorelib.paths import find_file
+
+# internal
+from ifgen import PKG_NAME, VERSION
+from ifgen.commands.args import add_profile_args
+from ifgen.paths import CACHE_ENV
+from ifgen.profile import profiling
+from ifgen.svd import (
+    DEFAULT_MIN_ENUM_WIDTH,
+    DEFAULT_SVD_CONFIG,
+    register_processors,
+    svd_config,
+)
+from ifgen.svd.backend import BACKENDS
+from ifgen.svd.cache import DEFAULT_CACHE_LIMIT, cached_svd
+from ifgen.svd.task import SvdProcessingTask
+
+
+def svd_cmd(args: _Namespace) -> int:
+    """Execute the svd command."""
+
+    with profiling(args.profile, args.cprofile):
+        svd(args)
+
+    return 0
+
+
+def is_pattern(value: str) -> bool:
+    """Determine if an SVD-file argument is a glob pattern."""
+    return any(x in value for x in "*?[")
+
+
+def svd_paths(values: Iterable[str]) -> list[Path]:
+    """Resolve SVD file paths, package URIs and glob patterns."""
+
+    logger = getLogger(__name__)
+
+    result: list[Path] = []
+    for value in values:
+        if is_pattern(value):
+            matches = sorted(
+                Path(x).resolve() for x in glob(value, recursive=True)
+            )
+            assert matches, f"No SVD files match '{value}'!"
+        else:
+            path = find_file(
+                value, package=PKG_NAME, logger=logger, include_cwd=True
+            )
+            assert path is not None, value
+            matches = [path]
+
+        result.extend(x for x in matches if x not in result)
+
+    return result
+
+
+def process_svd(
+    item: tuple[Path, Path],
+    config: str,
+    min_enum_width: int,
+    backend: str,
+    cache_limit: Optional[int],
+    generate: bool = False,
+    write_configs: bool = True,
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """
+    Process a single SVD file and generate configuration files (or code).
+    Returns a report of how long each step took and which includes were
+    filtered out.
+    """
+
+    path, output = item
+
+    # Worker processes don't necessarily inherit registered processors (e.g.
+    # with the 'spawn' start method).
+    register_processors()
+
+    start = perf_counter()
+    svd_config_data = svd_config(path, config)
+
+    if cache_limit is None:
+        task = SvdProcessingTask.svd(path, min_enum_width, backend=backend)
+    else:
+        task = cached_svd(
+            path, min_enum_width, backend=backend, limit=cache_limit
+        )
+    processed = perf_counter()
+
+    if generate:
+        filtered = task.generate_code(
+            output, svd_config_data, jobs=jobs, write_configs=write_configs
+        )
+    else:
+        filtered = task.generate_configs(output, svd_config_data, jobs=jobs)
+
+    return {
+        "svd": str(path),
+        "output": str(output),
+        "peripherals": len(task.model.peripherals),
+        "time": {
+            "svd": processed - start,
+            "generate_code" if generate else "generate_configs": (
+                perf_counter() - processed
+            ),
+        },
+        "filtered_includes": filtered,
+    }
+
+
+def svd(args: _Namespace) -> None:
+    """Process SVD files and generate configuration files."""
+
+    logger = getLogger(__name__)
+
+    paths = svd_paths(args.svd_files)
+
+    # Outputs go in per-file directories unless a single file (not a
+    # pattern, which could match any number of files) is given.
+    items = [(paths[0], args.output)]
+    if len(args.svd_files) > 1 or is_pattern(args.svd_files[0]):
+        items = [
+            (x, args.output.joinpath(x.with_suffix("").name)) for x in paths
+        ]
+        outputs = [x for _, x in items]
+        assert len(set(outputs)) == len(outputs), "Output directories clash!"
+
+    jobs = args.jobs if args.jobs is not None else (cpu_count() or 1)
+    handler = partial(
+        process_svd,
+        config=args.config,
+        min_enum_width=args.min_enum_width,
+        backend=args.backend,
+        cache_limit=(
+            None if args.no_cache else args.cache_limit * 1024 * 1024
+        ),
+        generate=args.generate,
+        write_configs=not args.generate or args.write_configs,
+    )
+
+    # A single file's outputs are encoded in parallel, otherwise files are
+    # processed in parallel.
+    results: list[dict[str, Any]]
+    if len(items) == 1 or jobs <= 1:
+        results = [handler(x, jobs=jobs) for x in items]
+    else:
+        with Pool(min(jobs, len(items))) as pool:
+            results = pool.map(handler, items, chunksize=1)
+
+    for result in results:
+        logger.info(
+            "%s: %d peripherals (%s) -> '%s'.",
+            result["svd"],
+            result["peripherals"],
+            ", ".join(
+                f"{value:.3f}s {key}" for key, value in result["time"].items()
+            ),
+            result["output"],
+        )
+        for include, reason in result["filtered_includes"].items():
+            logger.info(
+                "%s: filtered '%s' (%s).", result["svd"], include, reason
+            )
+
+    if args.report is not None:
+        ARBITER.encode(
+            args.report,
+            {"version": VERSION, "results": results},  # type: ignore
+        )
+        logger.info("Wrote '%s'.", args.report)
+
+
+def add_svd_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add svd-command arguments to its parser."""
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=f"{PKG_NAME}-out",
+        help=(
+            "output directory for configuration "
+            "files (default '%(default)s')"
+        ),
+    )
+
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=DEFAULT_SVD_CONFIG,
+        help="configuration rules to use (default: '%(default)s')",
+    )
+
+    parser.add_argument(
+        "-m",
+        "--min-enum-width",
+        type=int,
+        default=DEFAULT_MIN_ENUM_WIDTH,
+        help=(
+            "minimum number of enumeration elements to warrant "
+            "generating an enumeration definition (default: %(default)s)"
+        ),
+    )
+
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help=(
+            "XML parser to use, 'auto' uses 'lxml' if it's "
+            "installed (default: '%(default)s')"
+        ),
+    )
+
+    parser.add_argument(
+        "-g",
+        "--generate",
+        action="store_true",
+        help=(
+            "generate code directly, without writing (and loading) "
+            "configuration files"
+        ),
+    )
+    parser.add_argument(
+        "--write-configs",
+        action="store_true",
+        help="also write configuration files when generating code",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "don't load (or store) processed models in the cache "
+            f"(location: '${CACHE_ENV}' or the user cache directory)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-limit",
+        type=int,
+        default=DEFAULT_CACHE_LIMIT // (1024 * 1024),
+        help=(
+            "size limit of the model cache in MiB, least-recently used "
+            "models are evicted first (default: %(default)s)"
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help=(
+            "number of parallel jobs, processing SVD files (or encoding "
+            "outputs, for a single file) (default: CPU count)"
+        ),
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="write a JSON report of timings and filtered includes here",
+    )
+
+    add_profile_args(parser)
+
+    parser.add_argument(
+        "svd_files",
+        nargs="+",
+        help=(
+            "paths/uris (or glob patterns) of CMSIS-SVD files, outputs for "
+            "multiple files (or any patterns) are written to per-file "
+            "directories"
+        ),
+    )
+
+    return svd_cmd
@@ -0,0 +1,71 @@
+"""
+An entry-point for the 'synth' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from logging import getLogger
+from pathlib import Path
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+
+# internal
+from ifgen.bench.synthetic import PARAMETERS, SyntheticSpec, write_synthetic
+
+
+def synth_cmd(args: _Namespace) -> int:
+    """Execute the synth command."""
+
+    logger = getLogger(__name__)
+
+    spec = SyntheticSpec(**{name: getattr(args, name) for name in PARAMETERS})
+    logger.info("Totals: %s.", spec.totals)
+
+    for path in write_synthetic(
+        spec,
+        args.output,
+        svd=not args.no_svd,
+        config=not args.no_config,
+        config_suffix=".json" if args.json else ".yaml",
+    ):
+        logger.info("Wrote '%s'.", path)
+
+    return 0
+
+
+def add_synth_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add synth-command arguments to its parser."""
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=".",
+        help="directory to write outputs to (default: '%(default)s')",
+    )
+
+    for name, description in PARAMETERS.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=int,
+            default=getattr(SyntheticSpec, name),
+            help=f"{description} (default: %(default)s)",
+        )
+
+    parser.add_argument(
+        "--no-svd", action="store_true", help="don't write an SVD file"
+    )
+    parser.add_argument(
+        "--no-config",
+        action="store_true",
+        help="don't write an equivalent configuration",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="write the configuration as JSON (faster to load) not YAML",
+    )
+
+    return synth_cmd
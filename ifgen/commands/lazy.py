@@ -0,0 +1,54 @@
+"""
+A module implementing lazily-loaded commands.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+from importlib import import_module
+from typing import Any
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+from vcorelib.args import CommandRegister as _CommandRegister
+
+# internal
+from ifgen import PKG_NAME
+
+
+def lazy_command(name: str) -> _CommandRegister:
+    """
+    Create a command register that only imports a command's implementation
+    (which adds the command's arguments) when the command's parser is used.
+    This keeps start-up fast, since every command is registered on every
+    run.
+    """
+
+    def register(parser: _ArgumentParser) -> _CommandFunction:
+        """Register a command's parser."""
+
+        loaded: dict[str, _CommandFunction] = {}
+        parse_known_args = parser.parse_known_args
+
+        def load(*args: Any, **kwargs: Any) -> Any:
+            """Load the command (if necessary), then parse arguments."""
+
+            if name not in loaded:
+                module = import_module(f"{PKG_NAME}.commands.impl.{name}")
+                loaded[name] = getattr(module, f"add_{name}_cmd")(parser)
+
+            return parse_known_args(*args, **kwargs)
+
+        # A parent parser hands a command's arguments to the command parser's
+        # 'parse_known_args'.
+        parser.parse_known_args = load  # type: ignore
+
+        def run(args: _Namespace) -> int:
+            """Run the command."""
+
+            assert name in loaded, f"Command '{name}' wasn't loaded!"
+            return loaded[name](args)
+
+        return run
+
+    return register
@@ -0,0 +1,8 @@
+"""
+An entry-point for the 'serve' command (see 'commands.impl.serve').
+"""
+
+# internal
+from ifgen.commands.lazy import lazy_command
+
+add_serve_cmd = lazy_command("serve")
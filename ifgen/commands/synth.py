@@ -0,0 +1,8 @@
+"""
+An entry-point for the 'synth' command (see 'commands.impl.synth').
+"""
+
+# internal
+from ifgen.commands.lazy import lazy_command
+
+add_synth_cmd = lazy_command("synth")
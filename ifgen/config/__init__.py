@@ -3,7 +3,9 @@ A module implementing a configuration interface for the package.
 """
 
 # built-in
-from typing import Any
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Optional
 
 # third-party
 from vcorelib.dict import merge
@@ -11,16 +13,30 @@ from vcorelib.dict.codec import BasicDictCodec as _BasicDictCodec
 from vcorelib.io import ARBITER as _ARBITER
 from vcorelib.io import DEFAULT_INCLUDES_KEY
 from vcorelib.io.types import JsonObject as _JsonObject
-from vcorelib.paths import Pathlike, find_file
+from vcorelib.paths import Pathlike, find_file, normalize
 
 # internal
-from ifgen import PKG_NAME
+from ifgen import PKG_NAME, VERSION
+from ifgen.cache import file_digests, read_entry, write_entry
+from ifgen.config.includes import decode_includes
+from ifgen.paths import cache_dir
+from ifgen.profile import phase
 from ifgen.schemas import IfgenDictCodec
 
 
 class Config(IfgenDictCodec, _BasicDictCodec):
     """The top-level configuration object for the package."""
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get this instance's state for pickling. Data has already been
+        validated, so the (unpicklable) schema is left behind.
+        """
+
+        state = self.__dict__.copy()
+        state.pop("schema", None)
+        return state
+
     def init(self, data: _JsonObject) -> None:
         """Initialize this instance."""
 
@@ -49,24 +65,110 @@ class Config(IfgenDictCodec, _BasicDictCodec):
                 )
 
 
-def load(path: Pathlike) -> Config:
-    """Load a configuration object."""
+def config_cache(path: Path) -> Path:
+    """
+    Get the path to a (resolved) configuration file's cache entry. Entries
+    are kept in the user's cache directory (never in a project, where they
+    could be committed or checked out).
+    """
+
+    key = blake2b(str(path).encode(), digest_size=20).hexdigest()
+    return cache_dir("config", f"{key}.config")
+
+
+def cached_config(
+    path: Path, digests: dict[str, str] = None
+) -> Optional[Config]:
+    """
+    Load a validated configuration from a cache entry, if the entry exists
+    and no file that was loaded (including every included file) changed.
+    """
+
+    entry = read_entry(path)
+    if (
+        not isinstance(entry, dict)
+        or entry.get("version") != VERSION
+        or file_digests(Path(x) for x in entry["files"]) != entry["files"]
+    ):
+        return None
+
+    result = entry["config"]
+    assert isinstance(result, Config), result
+
+    if digests is not None:
+        digests.update(entry["files"])
+
+    return result
+
+
+def load(
+    path: Pathlike,
+    cache: bool = False,
+    jobs: int = 1,
+    digests: dict[str, str] = None,
+) -> Config:
+    """
+    Load a configuration object (from a cache entry if it's still valid,
+    when caching). Included files are decoded in parallel when more than one
+    job is requested. If provided, 'digests' is updated with a digest of
+    every file that was loaded.
+    """
+
+    path = normalize(path).resolve()
+    entry = config_cache(path)
+
+    if cache:
+        with phase("config.cache", key="load"):
+            result = cached_config(entry, digests=digests)
+        if result is not None:
+            return result
+
+    files: list[Any] = []
+    with phase("config.load"):
+        data = decode_includes(path, jobs=jobs, files_loaded=files)
+
+    result = from_data(data, files)
+
+    if cache or digests is not None:
+        # Loaded includes are also recorded by name, only keep actual paths.
+        loaded = file_digests(
+            {x.resolve() for x in files if isinstance(x, Path)}
+        )
+        if digests is not None:
+            digests.update(loaded)
+
+        if cache:
+            with phase("config.cache", key="save"):
+                write_entry(
+                    entry,
+                    {"version": VERSION, "files": loaded, "config": result},
+                )
+
+    return result
+
+
+def from_data(data: _JsonObject, files: list[Any] = None) -> Config:
+    """
+    Create a configuration object from project-specific data (already loaded,
+    or created in memory) and package defaults.
+    """
 
     src_config = find_file("default.yaml", package=PKG_NAME)
     assert src_config is not None
 
-    data = merge(
-        _ARBITER.decode(
-            src_config,
-            includes_key=DEFAULT_INCLUDES_KEY,
-            require_success=True,
-        ).data,
-        _ARBITER.decode(
-            path, includes_key=DEFAULT_INCLUDES_KEY, require_success=True
-        ).data,
-        # Always allow the project-specific configuration to override package
-        # data.
-        expect_overwrite=True,
-    )
-
-    return Config.create(data)
+    with phase("config.load"):
+        data = merge(
+            _ARBITER.decode(
+                src_config,
+                includes_key=DEFAULT_INCLUDES_KEY,
+                require_success=True,
+                files_loaded=files,
+            ).data,
+            data,
+            # Always allow the project-specific configuration to override
+            # package data.
+            expect_overwrite=True,
+        )
+
+    with phase("config.validate"):
+        return Config.create(data)
@@ -0,0 +1,102 @@
+"""
+A module implementing a configuration loader that decodes included files in
+worker processes.
+"""
+
+# built-in
+from multiprocessing import Pool
+from os import cpu_count
+from typing import Any, Iterable
+
+# third-party
+from vcorelib.dict import merge
+from vcorelib.io import ARBITER as _ARBITER
+from vcorelib.io import DEFAULT_INCLUDES_KEY
+from vcorelib.io.types import JsonObject as _JsonObject
+from vcorelib.paths import Pathlike, find_file, normalize
+
+LEFT_INCLUDES_KEY = f"{DEFAULT_INCLUDES_KEY}_left"
+
+
+def decode_file(path: Pathlike) -> tuple[_JsonObject, list[Any]]:
+    """Decode a file (and everything it includes)."""
+
+    files: list[Any] = []
+    data = _ARBITER.decode(
+        path,
+        includes_key=DEFAULT_INCLUDES_KEY,
+        require_success=True,
+        files_loaded=files,
+    ).data
+    return data, files
+
+
+def decode_includes(
+    path: Pathlike, jobs: int = None, files_loaded: list[Any] = None
+) -> _JsonObject:
+    """
+    Decode a configuration file and its includes. Files included by the
+    top-level file are decoded in parallel and merged in the same order (and
+    with the same semantics) that the data arbiter uses.
+    """
+
+    if files_loaded is None:
+        files_loaded = []
+
+    if jobs is None:
+        jobs = cpu_count() or 1
+
+    path = normalize(path)
+
+    if jobs <= 1:
+        data, files = decode_file(path)
+        files_loaded.extend(files)
+        return data
+
+    data = _ARBITER.decode(path, require_success=True).data
+    files_loaded.append(path)
+
+    # Includes are merged first (preferring existing data), then 'left'
+    # includes are merged (preferring included data).
+    includes: list[tuple[str, str]] = [
+        (key, include)  # type: ignore
+        for key in [DEFAULT_INCLUDES_KEY, LEFT_INCLUDES_KEY]
+        for include in data.pop(key, [])  # type: ignore
+    ]
+    paths = [
+        find_file(include, relative_to=path, strict=True)
+        for _, include in includes
+    ]
+
+    if len(paths) <= 1:
+        return _merge_includes(
+            data, includes, map(decode_file, paths), files_loaded
+        )
+
+    # Included files vary a lot in size, so they're handed out one at a
+    # time.
+    with Pool(min(jobs, len(paths))) as pool:
+        return _merge_includes(
+            data, includes, pool.imap(decode_file, paths), files_loaded
+        )
+
+
+def _merge_includes(
+    data: _JsonObject,
+    includes: list[tuple[str, str]],
+    results: Iterable[tuple[_JsonObject, list[Any]]],
+    files_loaded: list[Any],
+) -> _JsonObject:
+    """Merge decoded includes into top-level data (in declared order)."""
+
+    for (key, include), (included, files) in zip(includes, results):
+        files_loaded.extend(files)
+        files_loaded.append(include)
+
+        data = (
+            merge(data, included)
+            if key == DEFAULT_INCLUDES_KEY
+            else merge(included, data)
+        )
+
+    return data
@@ -3,32 +3,30 @@ A module implementing a generation-environment interface.
 """
 
 # built-in
-from enum import StrEnum
 from pathlib import Path
-from shutil import rmtree
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
 
 # third-party
 from runtimepy.codec.protocol import Protocol
 from runtimepy.codec.system import TypeSystem
 from runtimepy.enum import RuntimeEnum
 from vcorelib.logging import LoggerMixin
+from vcorelib.namespace import CPP_DELIM
 from vcorelib.paths import normalize, rel
 
 # internal
-from ifgen import PKG_NAME
 from ifgen.config import Config
 from ifgen.environment.field import process_field
+from ifgen.environment.generator import Generator
+from ifgen.environment.index import TypeIndex, TypeInfo, lookup_type
+from ifgen.environment.layout import FieldLayout, StructLayout, TypeKind
+from ifgen.environment.outputs import OutputTracker
 from ifgen.environment.padding import PaddingManager, type_string
 from ifgen.paths import combine_if_not_absolute
+from ifgen.profile import phase
 
-
-class Generator(StrEnum):
-    """An enumeration declaring all valid kinds of generators."""
-
-    STRUCTS = "structs"
-    ENUMS = "enums"
-    IFGEN = PKG_NAME
+__all__ = ["Generator", "IfgenEnvironment", "runtime_enum_data"]
 
 
 def runtime_enum_data(data: dict[str, Any]) -> dict[str, int]:
@@ -70,21 +68,66 @@ class IfgenEnvironment(LoggerMixin):
             self.source, normalize(*self.config.data["test_dir"])
         )
 
-        self.generated: set[Path] = set()
+        self.outputs = OutputTracker()
 
         # Create output directories.
+        for dest in self.output_dirs:
+            dest.mkdir(parents=True, exist_ok=True)
+
+        self.types = TypeSystem(*self.config.data["namespace"])
+
+        types: dict[str, TypeInfo] = {}
+        enums: dict[str, RuntimeEnum] = {}
+        layouts: dict[str, StructLayout] = {}
+        with phase("register.enums"):
+            self._register_enums(types, enums)
+        with phase("register.structs"):
+            self._register_structs(types, layouts)
+
+        # Resolve type information and every instance's namespace up front so
+        # that generators (which may run concurrently) never need to query
+        # the type system.
+        self.index = TypeIndex(types, enums, layouts, self._namespace_table())
+
+    @property
+    def generated(self) -> set[Path]:
+        """Get the set of paths that tasks could produce."""
+        return self.outputs.generated
+
+    @property
+    def namespaces(self) -> Mapping[tuple[str, ...], str]:
+        """Get the namespace table (keyed by instance namespace)."""
+        return self.index.namespaces
+
+    @property
+    def output_dirs(self) -> Iterator[Path]:
+        """Iterate over all output directories."""
+
         for subdir in Generator:
             for path in [self.output, self.test_dir]:
-                dest = path.joinpath(subdir)
-                rmtree(dest, ignore_errors=True)
-                dest.mkdir(parents=True, exist_ok=True)
+                yield path.joinpath(subdir)
 
-        self.types = TypeSystem(*self.config.data["namespace"])
-        self.padding = PaddingManager()
-        self._register_enums()
-        self._register_structs()
+    def _resolve_namespace(self, names: Iterable[str]) -> str:
+        """Resolve a namespace relative to the project's root namespace."""
+
+        nspace = self.types.root_namespace
+        return nspace.delim.join(x for x in [*nspace.stack, *names] if x)
+
+    def _namespace_table(self) -> dict[tuple[str, ...], str]:
+        """Create a table of every instance's namespace."""
+
+        table: dict[tuple[str, ...], str] = {(): self._resolve_namespace(())}
+        for generator in Generator:
+            for instance in self.config.data.get(generator.value, {}).values():
+                names = tuple(instance.get("namespace", []))
+                if names not in table:
+                    table[names] = self._resolve_namespace(names)
 
-    def _register_enums(self) -> None:
+        return table
+
+    def _register_enums(
+        self, types: dict[str, TypeInfo], enums: dict[str, RuntimeEnum]
+    ) -> None:
         """Register configuration enums."""
 
         for name, enum in self.config.data.get("enums", {}).items():
@@ -95,6 +138,16 @@ class IfgenEnvironment(LoggerMixin):
                 primitive=type_string(enum["underlying"]),
             )
 
+            enums[name] = self.types.get_enum(name, *enum["namespace"])
+            types[name] = TypeInfo(
+                name,
+                Generator.ENUMS,
+                TypeKind.ENUM,
+                self.types.size(name, *enum["namespace"]),
+                enums[name].primitive,
+                self.make_path(name, Generator.ENUMS, track=False),
+            )
+
             self.logger.info(
                 "Registered enum '%s'.",
                 self.types.root_namespace.delim.join(
@@ -102,38 +155,61 @@ class IfgenEnvironment(LoggerMixin):
                 ),
             )
 
-    def _register_structs(self) -> None:
+    def _register_structs(
+        self, types: dict[str, TypeInfo], layouts: dict[str, StructLayout]
+    ) -> None:
         """Register configuration structs."""
 
         for name, struct in self.config.data.get("structs", {}).items():
             namespace = [*struct["namespace"]]
             self.types.register(name, *namespace)
 
-            field_groups = []
+            fields: dict[str, FieldLayout] = {}
+            offset = 0
+            all_fields = []
 
-            self.padding.reset()
+            padding = PaddingManager()
             for field in struct["fields"]:
-                padding = list(
-                    process_field(
-                        name, self.padding, self.types, field, namespace
+                # Alternates share their parent's type (unless specified).
+                for alternate in field.get("alternates", []):
+                    alternate.setdefault("type", field["type"])
+
+                # Padding fields (if any) are inserted before this field.
+                for item in [
+                    *process_field(name, padding, self.types, field, offset),
+                    field,
+                ]:
+                    info = lookup_type(types, item["type"])
+                    assert info is not None, (name, item["name"])
+
+                    fields[item["name"]] = FieldLayout.create(
+                        item, offset, info.size, info.kind
                     )
-                )
-                if padding:
-                    field_groups.append(padding)
-                field_groups.append([field])
+                    offset += fields[item["name"]].size
+                    all_fields.append(item)
 
             # Re-assign fields structure.
-            struct["fields"] = []
-            for group in field_groups:
-                for field in group:
-                    struct["fields"].append(field)
+            struct["fields"] = all_fields
+
+            size = self.types.size(name, *namespace)
+            assert offset == size, (name, offset, size)
+
+            layouts[name] = StructLayout(name, size, MappingProxyType(fields))
+            types[name] = TypeInfo(
+                name,
+                Generator.STRUCTS,
+                TypeKind.STRUCT,
+                size,
+                None,
+                self.make_path(name, Generator.STRUCTS, track=False),
+            )
 
             self.logger.info(
                 "Registered struct '%s' (%d bytes).",
                 self.types.root_namespace.delim.join(
                     struct["namespace"] + [name]
                 ),
-                self.types.size(name, *struct["namespace"]),
+                size,
             )
 
     def make_path(
@@ -173,34 +249,27 @@ class IfgenEnvironment(LoggerMixin):
         """Get the protocol instance for a given struct."""
 
         return self.types.get_protocol(
-            name, self.config.data["structs"].get("namespace", []), exact=exact
+            name,
+            *self.config.data["structs"].get("namespace", []),
+            exact=exact,
         )
 
     def is_struct(self, name: str) -> bool:
         """Determine if a field is a struct or not."""
 
-        try:
-            self.get_protocol(type_string(name))
-            return True
-        except KeyError:
-            return False
+        info = self.index.get(name)
+        return info is not None and info.kind is TypeKind.STRUCT
 
-    def size(self, type_name: str, exact: bool = False) -> int:
+    def size(self, type_name: str) -> int:
         """Get the size of a given type."""
-        return self.types.size(type_string(type_name), exact=exact)
+        return self.index[type_name].size
 
-    def get_enum(self, name: str, exact: bool = False) -> RuntimeEnum:
+    def get_enum(self, name: str) -> RuntimeEnum:
         """Get a runtime enum instance for a given enumeration."""
+        return self.index.enums[name.split(CPP_DELIM)[-1]]
 
-        return self.types.get_enum(
-            name, *self.config.data["enums"].get("namespace", []), exact=exact
-        )
-
-    def is_enum(self, name: str, exact: bool = False) -> bool:
+    def is_enum(self, name: str) -> bool:
         """Determine if a field is an enumeration or not."""
 
-        try:
-            self.get_enum(type_string(name), exact=exact)
-            return True
-        except KeyError:
-            return False
+        info = self.index.get(name)
+        return info is not None and info.kind is TypeKind.ENUM
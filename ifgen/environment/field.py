@@ -17,21 +17,20 @@ def process_field(
     padding: PaddingManager,
     types: TypeSystem,
     field: dict[str, Any],
-    namespace: list[str],
+    offset: int,
 ) -> Iterator[StructField]:
-    """Process a single struct field."""
+    """Process a single struct field (at a given offset)."""
 
     field_name = field["name"]
 
     # Validate expected offset.
     if "expected_offset" in field:
-        size = types.size(struct_name, *namespace)
         expected: int = field["expected_offset"]
 
-        difference = expected - size
+        difference = expected - offset
 
         assert difference >= 0, (
-            f"{difference} ({struct_name}.{field_name}) current={size} "
+            f"{difference} ({struct_name}.{field_name}) current={offset} "
             f"!= expected={expected}"
         )
 
@@ -41,7 +40,11 @@ def process_field(
                 # Padding should never generate more padding.
                 assert not list(
                     process_field(
-                        struct_name, padding, types, padding_field, namespace
+                        struct_name,
+                        padding,
+                        types,
+                        padding_field,
+                        offset,
                     )
                 )
 
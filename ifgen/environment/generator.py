@@ -0,0 +1,17 @@
+"""
+A module declaring the kinds of generators.
+"""
+
+# built-in
+from enum import StrEnum
+
+# internal
+from ifgen import PKG_NAME
+
+
+class Generator(StrEnum):
+    """An enumeration declaring all valid kinds of generators."""
+
+    STRUCTS = "structs"
+    ENUMS = "enums"
+    IFGEN = PKG_NAME
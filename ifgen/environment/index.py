@@ -0,0 +1,91 @@
+"""
+A module implementing a read-only index of types that fields can refer to.
+"""
+
+# built-in
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+# third-party
+from runtimepy.enum import RuntimeEnum
+from runtimepy.primitives.types import PrimitiveTypes
+from vcorelib.namespace import CPP_DELIM
+
+# internal
+from ifgen.environment.generator import Generator
+from ifgen.environment.layout import StructLayout, TypeKind
+from ifgen.environment.padding import type_string
+
+
+class TypeInfo(NamedTuple):
+    """A container for precomputed type information."""
+
+    name: str
+    generator: Optional[Generator]
+    kind: TypeKind
+    size: int
+
+    # The underlying primitive (for primitives and enumerations).
+    primitive: Optional[str]
+
+    # A path to the type's generated header (for custom types).
+    include: Optional[Path]
+
+
+PRIMITIVES: Mapping[str, TypeInfo] = MappingProxyType(
+    {
+        name: TypeInfo(
+            name, None, TypeKind.PRIMITIVE, kind.size, kind.name, None
+        )
+        for name, kind in PrimitiveTypes.items()
+    }
+)
+
+
+def lookup_type(
+    types: Mapping[str, TypeInfo], name: str
+) -> Optional[TypeInfo]:
+    """Look up a custom (by final name) or primitive type."""
+
+    final = name.split(CPP_DELIM)[-1]
+    result = types.get(final)
+    if result is None:
+        result = PRIMITIVES.get(type_string(final))
+    return result
+
+
+class TypeIndex:
+    """
+    A class for looking up types, struct layouts and namespaces without
+    querying the type system.
+    """
+
+    def __init__(
+        self,
+        types: Mapping[str, TypeInfo],
+        enums: Mapping[str, RuntimeEnum],
+        layouts: Mapping[str, StructLayout],
+        namespaces: Mapping[tuple[str, ...], str],
+    ) -> None:
+        """Initialize this instance."""
+
+        self.types: Mapping[str, TypeInfo] = MappingProxyType(dict(types))
+        self.enums: Mapping[str, RuntimeEnum] = MappingProxyType(dict(enums))
+        self.layouts: Mapping[str, StructLayout] = MappingProxyType(
+            dict(layouts)
+        )
+        self.namespaces: Mapping[tuple[str, ...], str] = MappingProxyType(
+            dict(namespaces)
+        )
+
+    def get(self, name: str) -> Optional[TypeInfo]:
+        """Look up a type by name (custom types by their final name)."""
+        return lookup_type(self.types, name)
+
+    def __getitem__(self, name: str) -> TypeInfo:
+        """Look up a type that must exist."""
+
+        result = self.get(name)
+        assert result is not None, f"Unknown type '{name}'!"
+        return result
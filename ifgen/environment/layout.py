@@ -0,0 +1,59 @@
+"""
+A module implementing interfaces for precomputed struct layouts.
+"""
+
+# built-in
+from enum import StrEnum
+from typing import Any, Mapping, NamedTuple, Optional
+
+
+class TypeKind(StrEnum):
+    """An enumeration declaring all kinds of field types."""
+
+    PRIMITIVE = "primitive"
+    STRUCT = "struct"
+    ENUM = "enum"
+
+
+class FieldLayout(NamedTuple):
+    """A container for a struct field's position and type information."""
+
+    name: str
+    type: str
+    offset: int
+
+    # The size of a single element (for array fields) in bytes.
+    element_size: int
+
+    kind: TypeKind
+    padding: bool
+    array_length: Optional[int]
+
+    @property
+    def size(self) -> int:
+        """Get this field's total size in bytes."""
+        return self.element_size * (self.array_length or 1)
+
+    @staticmethod
+    def create(
+        field: dict[str, Any], offset: int, element_size: int, kind: TypeKind
+    ) -> "FieldLayout":
+        """Create a field layout from field configuration data."""
+
+        return FieldLayout(
+            field["name"],
+            field["type"],
+            offset,
+            element_size,
+            kind,
+            field.get("padding", False),
+            field.get("array_length"),
+        )
+
+
+class StructLayout(NamedTuple):
+    """A container for a struct's layout (fields in declaration order)."""
+
+    name: str
+    size: int
+    fields: Mapping[str, FieldLayout]
@@ -0,0 +1,95 @@
+"""
+A module implementing an interface for tracking generated output files.
+"""
+
+# built-in
+from pathlib import Path
+from threading import Lock
+
+# third-party
+from vcorelib import DEFAULT_ENCODING
+
+# internal
+from ifgen.paths import write_atomic
+from ifgen.profile import phase
+
+
+def write_if_changed(path: Path, data: str) -> bool:
+    """
+    Write data to a file only if its contents would change. The file is
+    replaced atomically when written.
+    """
+
+    raw = data.encode(DEFAULT_ENCODING)
+
+    try:
+        if path.read_bytes() == raw:
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_atomic(path, raw)
+    return True
+
+
+class OutputTracker:
+    """A class for keeping track of the files that tasks write."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        # Every path that a task could produce.
+        self.generated: set[Path] = set()
+
+        # Files written by each task (by task key).
+        self.written: dict[str, set[Path]] = {}
+
+        self.counts = {"written": 0, "unchanged": 0, "removed": 0}
+        self.lock = Lock()
+
+    def record(self, key: str, path: Path) -> None:
+        """Record that a task (by key) wrote an output file."""
+        self.written.setdefault(key, set()).add(path)
+
+    def merge(
+        self, key: str, written: set[Path], counts: dict[str, int]
+    ) -> None:
+        """Merge the results of work done by another tracker."""
+
+        with self.lock:
+            self.written.setdefault(key, set()).update(written)
+            for kind, count in counts.items():
+                self.counts[kind] += count
+
+    def outputs(self, key: str) -> set[Path]:
+        """Get the files that a task (by key) wrote."""
+        return self.written.get(key, set())
+
+    def _count(self, kind: str) -> None:
+        """Increment a counter."""
+
+        with self.lock:
+            self.counts[kind] += 1
+
+    def write(self, key: str, path: Path, data: str) -> bool:
+        """Write an output file for a task (if its contents changed)."""
+
+        self.record(key, path)
+        with phase("write", key=key):
+            result = write_if_changed(path, data)
+        self._count("written" if result else "unchanged")
+        return result
+
+    def remove(self, path: Path) -> bool:
+        """Remove an output file (if it exists)."""
+
+        result = path.is_file()
+        if result:
+            path.unlink()
+            self._count("removed")
+        return result
+
+    def summary(self) -> str:
+        """Get a summary of this run's file-system activity."""
+
+        return ", ".join(f"{val} {key}" for key, val in self.counts.items())
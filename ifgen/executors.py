@@ -0,0 +1,11 @@
+"""
+A module defining how parallel generation jobs can be run (without importing
+anything that generation needs, so that command-line arguments can use it).
+"""
+
+EXECUTORS = ("thread", "process")
+
+
+def check_executor(executor: str) -> None:
+    """Ensure that an executor is known."""
+    assert executor in EXECUTORS, f"Unknown executor '{executor}'!"
@@ -3,16 +3,23 @@ A module implementing interfaces to facilitate code generation.
 """
 
 # built-in
+from logging import WARNING, getLogger
+from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
+from os import cpu_count
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 # internal
 from ifgen.common import create_common, create_common_test
 from ifgen.config import Config
 from ifgen.enum import create_enum, create_enum_source, create_enum_test
 from ifgen.environment import Generator, IfgenEnvironment
+from ifgen.environment.outputs import OutputTracker
+from ifgen.executors import check_executor
+from ifgen.generation.cache import GenerationCache, task_digest
 from ifgen.generation.interface import GenerateTask, InstanceGenerator
+from ifgen.profile import phase
 from ifgen.struct import (
     create_struct,
     create_struct_source,
@@ -30,27 +37,204 @@ GENERATORS: Dict[Generator, List[InstanceGenerator]] = {
 }
 
 
-def generate(root: Path, config: Config) -> None:
+WorkItem = Tuple[InstanceGenerator, GenerateTask]
+
+# A picklable reference to a work item: (generator, task name, method index).
+RemoteItem = Tuple[Generator, str, int]
+
+
+def create_task(
+    env: IfgenEnvironment, generator: Generator, name: str
+) -> GenerateTask:
+    """Create a generation task for a configured instance."""
+
+    return GenerateTask(
+        name,
+        generator,
+        env.make_path(name, generator, from_output=True),
+        env.make_test_path(name, generator),
+        env.config.data[generator.value][name],
+        env,
+    )
+
+
+def run_item(item: WorkItem) -> str:
+    """Run a single generation method for a task."""
+
+    method, task = item
+    with phase(f"generate.{method.__name__}", key=task.key):
+        method(task)
+    return task.key
+
+
+# Each worker process's own environment (see 'init_worker').
+WORKER_ENV: Optional[IfgenEnvironment] = None
+
+
+def init_worker(root: Path, config: Config) -> None:
+    """
+    Initialize a worker process from a snapshot of the parent's (already
+    registered) configuration data.
+    """
+
+    # The parent already logged type registration.
+    getLogger(IfgenEnvironment.__module__).setLevel(WARNING)
+
+    global WORKER_ENV  # pylint: disable=global-statement
+    WORKER_ENV = IfgenEnvironment(root, config)
+
+
+def run_remote_item(
+    item: RemoteItem,
+) -> tuple[str, set[Path], dict[str, int]]:
+    """Run a single generation method for a task, in a worker process."""
+
+    env = WORKER_ENV
+    assert env is not None, "Worker environment not initialized!"
+
+    # Track outputs per item so that they can be sent back to the parent.
+    env.outputs = OutputTracker()
+
+    generator, name, index = item
+    key = run_item(
+        (GENERATORS[generator][index], create_task(env, generator, name))
+    )
+    return key, env.outputs.outputs(key), env.outputs.counts
+
+
+def run_items(
+    items: list[WorkItem], jobs: int = None, executor: str = "thread"
+) -> None:
+    """
+    Run generation work items from a single queue, so that no one
+    (generator, method) pair holds up the rest.
+    """
+
+    check_executor(executor)
+
+    if jobs is None:
+        jobs = cpu_count() or 1
+
+    if jobs <= 1 or len(items) <= 1:
+        for item in items:
+            run_item(item)
+        return
+
+    # Similar to the chunk size heuristic that Pool.map uses.
+    chunksize, extra = divmod(len(items), jobs * 4)
+    if extra:
+        chunksize += 1
+
+    if executor == "thread":
+        with ThreadPool(jobs) as pool:
+            for _ in pool.imap_unordered(run_item, items, chunksize=chunksize):
+                pass
+        return
+
+    # Worker processes rebuild the environment from the parent's
+    # configuration data and send back what they wrote.
+    env = items[0][1].env
+    remote = [
+        (task.generator, task.name, GENERATORS[task.generator].index(method))
+        for method, task in items
+    ]
+    with Pool(
+        jobs, initializer=init_worker, initargs=(env.root_path, env.config)
+    ) as pool:
+        for key, written, counts in pool.imap_unordered(
+            run_remote_item, remote, chunksize=chunksize
+        ):
+            env.outputs.merge(key, written, counts)
+
+
+def generate(
+    root: Path,
+    config: Config,
+    force: bool = False,
+    jobs: int = None,
+    executor: str = "thread",
+) -> None:
     """Generate struct files."""
 
-    env = IfgenEnvironment(root, config)
-
-    with ThreadPool() as pool:
-        for generator, methods in GENERATORS.items():
-            for method in methods:
-                pool.map(
-                    method,
-                    (
-                        GenerateTask(
-                            name,
-                            generator,
-                            env.make_path(name, generator, from_output=True),
-                            env.make_test_path(name, generator),
-                            data,
-                            env,
-                        )
-                        for name, data in config.data.get(
-                            generator.value, {}
-                        ).items()
-                    ),
-                )
+    generate_environment(
+        IfgenEnvironment(root, config),
+        force=force,
+        jobs=jobs,
+        executor=executor,
+    )
+
+
+def generate_environment(
+    env: IfgenEnvironment,
+    force: bool = False,
+    jobs: int = None,
+    executor: str = "thread",
+) -> None:
+    """
+    Generate outputs for an environment (with types already registered, so
+    that an environment can be re-used).
+    """
+
+    config = env.config
+    cache = GenerationCache(env.root_path, env.outputs, force=force)
+
+    tasks: dict[Generator, list[GenerateTask]] = {
+        generator: [
+            create_task(env, generator, name)
+            for name in config.data.get(generator.value, {})
+        ]
+        for generator in GENERATORS
+    }
+
+    # Digests decide which tasks are pending (and are recorded for those
+    # tasks once they've been generated).
+    with phase("digest"):
+        digests = {
+            task.key: task_digest(task)
+            for generator_tasks in tasks.values()
+            for task in generator_tasks
+        }
+
+    # Only generate tasks whose inputs changed (or whose outputs are missing).
+    pending = {
+        generator: [
+            task
+            for task in generator_tasks
+            if not cache.fresh(task.key, digests[task.key])
+        ]
+        for generator, generator_tasks in tasks.items()
+    }
+    num_pending = sum(len(x) for x in pending.values())
+    env.logger.info("Generating %d of %d task(s).", num_pending, len(digests))
+
+    run_items(
+        [
+            (method, task)
+            for generator, methods in GENERATORS.items()
+            for method in methods
+            for task in pending[generator]
+        ],
+        jobs=jobs,
+        executor=executor,
+    )
+
+    for generator_tasks in pending.values():
+        for task in generator_tasks:
+            cache.update(
+                task.key, digests[task.key], env.outputs.outputs(task.key)
+            )
+
+    cache.prune(digests)
+
+    # Without a record of which task produced which output (or when forced),
+    # remove anything that wasn't just generated.
+    if force or not cache.loaded:
+        cache.sweep(env.output_dirs)
+
+    cache.save()
+
+    env.logger.info(
+        "Files: %s (%d task(s) up-to-date).",
+        env.outputs.summary(),
+        len(digests) - num_pending,
+    )
@@ -0,0 +1,186 @@
+"""
+A module implementing a content-hash build cache for generation tasks.
+"""
+
+# built-in
+from json import dumps
+from pathlib import Path
+from typing import Any, Iterable
+
+# third-party
+from vcorelib.io import ARBITER
+from vcorelib.logging import LoggerMixin
+from vcorelib.paths import rel, str_hash_hex
+
+# internal
+from ifgen import VERSION
+from ifgen.environment import Generator
+from ifgen.environment.outputs import OutputTracker
+from ifgen.generation.interface import GenerateTask, instance_types
+from ifgen.paths import CACHE_DIR
+from ifgen.struct.methods import protocol_json
+
+
+def task_digest(task: GenerateTask) -> str:
+    """
+    Compute a digest over everything that can affect a task's outputs: the
+    package version, project-wide settings, the task's instance data, the
+    instance data of every type it (transitively) depends on and any
+    registration-time data (identifiers, JSON) that the task embeds.
+    """
+
+    config = task.config
+
+    dependencies: dict[str, Any] = {}
+    ids: dict[str, int] = {}
+
+    to_visit = [(task.generator, task.name)]
+    while to_visit:
+        generator, name = to_visit.pop()
+        key = f"{generator}/{name}"
+        if key in dependencies:
+            continue
+
+        instance = config.get(generator.value, {})[name]
+        dependencies[key] = instance
+
+        # Enumeration identifiers depend on registration order.
+        if generator is Generator.ENUMS:
+            ids[key] = task.env.get_enum(name).id
+
+        for kind in instance_types(instance):
+            lookup = task.check_custom_type(kind)
+            if lookup is not None:
+                to_visit.append((lookup.generator, lookup.final))
+
+    embedded: dict[str, Any] = {}
+    if task.generator is Generator.STRUCTS:
+        # Struct identifiers depend on registration order.
+        if task.instance.get("identifier"):
+            embedded["id"] = task.protocol().id
+
+        # JSON data includes every registered enumeration (and identifier).
+        if task.instance.get("json"):
+            embedded["json"] = protocol_json(task)
+
+    return str_hash_hex(
+        dumps(
+            {
+                "version": VERSION,
+                "settings": {
+                    key: value
+                    for key, value in config.items()
+                    if key
+                    not in {Generator.STRUCTS.value, Generator.ENUMS.value}
+                },
+                "dependencies": dependencies,
+                "ids": ids,
+                "embedded": embedded,
+            },
+            sort_keys=True,
+            default=str,
+        )
+    )
+
+
+class GenerationCache(LoggerMixin):
+    """
+    A class for tracking which outputs each generation task produced, and from
+    what inputs.
+    """
+
+    def __init__(
+        self, root: Path, tracker: OutputTracker, force: bool = False
+    ) -> None:
+        """Initialize this instance."""
+
+        super().__init__()
+
+        self.root = root
+        self.path = root.joinpath(CACHE_DIR, "generate.json")
+        self.tracker = tracker
+
+        self.tasks: dict[str, dict[str, Any]] = {}
+
+        # Whether or not outputs on disk are known to belong to tasks.
+        self.loaded = False
+
+        if self.path.is_file():
+            result = ARBITER.decode(self.path, logger=self.logger)
+            if result.success:
+                self.tasks = result.data.get("tasks", {})  # type: ignore
+                self.loaded = True
+
+        # Keep track of previous outputs (so that stale ones can be removed)
+        # but don't consider any task up-to-date.
+        if force:
+            for entry in self.tasks.values():
+                entry["digest"] = None
+
+    def outputs(self, key: str) -> set[Path]:
+        """Get the outputs previously recorded for a task."""
+
+        return {
+            self.root.joinpath(x)
+            for x in self.tasks.get(key, {}).get("outputs", [])
+        }
+
+    def fresh(self, key: str, digest: str) -> bool:
+        """
+        Determine if a task's previous outputs are still valid for a given
+        digest.
+        """
+
+        return self.tasks.get(key, {}).get("digest") == digest and all(
+            x.is_file() for x in self.outputs(key)
+        )
+
+    def _remove(self, paths: Iterable[Path]) -> None:
+        """Remove output files."""
+
+        for path in paths:
+            if self.tracker.remove(path):
+                self.logger.info("Removed stale output '%s'.", path)
+
+    def update(self, key: str, digest: str, outputs: set[Path]) -> None:
+        """
+        Record the outputs for a task, removing any previous outputs that
+        weren't produced again.
+        """
+
+        self._remove(self.outputs(key) - outputs)
+        self.tasks[key] = {
+            "digest": digest,
+            "outputs": sorted(str(rel(x, base=self.root)) for x in outputs),
+        }
+
+    def prune(self, keys: Iterable[str]) -> None:
+        """Remove outputs (and entries) for tasks that no longer exist."""
+
+        active = set(keys)
+        for key in set(self.tasks) - active:
+            self._remove(self.outputs(key))
+            del self.tasks[key]
+
+    def sweep(self, directories: Iterable[Path]) -> None:
+        """Remove files in output directories that no task produced."""
+
+        known = set()
+        for key in self.tasks:
+            known |= self.outputs(key)
+
+        for directory in directories:
+            self._remove(
+                x
+                for x in directory.rglob("*")
+                if x.is_file() and x not in known
+            )
+
+    def save(self) -> None:
+        """Write this cache to disk."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        ARBITER.encode(
+            self.path,
+            {"version": VERSION, "tasks": self.tasks},  # type: ignore
+        )
@@ -4,6 +4,7 @@ A module defining generator interfaces.
 
 # built-in
 from contextlib import ExitStack, contextmanager
+from io import StringIO
 from json import dumps
 from pathlib import Path
 from typing import (
@@ -26,6 +27,7 @@ from vcorelib.namespace import CPP_DELIM
 # internal
 from ifgen import PKG_NAME, VERSION
 from ifgen.environment import Generator, IfgenEnvironment
+from ifgen.environment.layout import StructLayout
 
 InstanceConfig = Dict[str, Any]
 IfgenConfig = Dict[str, Any]
@@ -39,6 +41,25 @@ class TypeLookup(NamedTuple):
     generator: Generator
 
 
+def instance_types(instance: InstanceConfig) -> Iterator[str]:
+    """Iterate over the type names that an instance's fields refer to."""
+
+    for config in instance.get("fields", []):
+        if "type" in config:
+            yield config["type"]
+
+        # Bit-field types.
+        for bit_field in config.get("fields", []):
+            if "type" in bit_field:
+                yield bit_field["type"]
+
+        # Alternate bit-field types.
+        for alternate in config.get("alternates", []):
+            for alternate_bit_field in alternate.get("fields", []):
+                if "type" in alternate_bit_field:
+                    yield alternate_bit_field["type"]
+
+
 class GenerateTask(NamedTuple):
     """A container for instance-generation tasks."""
 
@@ -60,6 +81,11 @@ class GenerateTask(NamedTuple):
             data = f"{self.name}::{data}"
         return data if not prefix else prefix + data
 
+    @property
+    def key(self) -> str:
+        """Get a key that uniquely identifies this task."""
+        return f"{self.generator}/{self.name}"
+
     @property
     def stream_implementation(self) -> bool:
         """
@@ -82,6 +108,11 @@ class GenerateTask(NamedTuple):
 
         return self.env.get_enum(self.name)
 
+    @property
+    def layout(self) -> StructLayout:
+        """Get this (struct) task's precomputed layout."""
+        return self.env.index.layouts[self.name]
+
     def protocol(self) -> Protocol:
         """Loop up a protocol for this task."""
 
@@ -90,9 +121,9 @@ class GenerateTask(NamedTuple):
     def namespace(self, *names: str) -> str:
         """Get this task's namespace."""
 
-        nspace = self.env.types.root_namespace
-        with nspace.pushed(*self.instance.get("namespace", []), *names):
-            result = nspace.namespace(track=False)
+        result = self.env.namespaces[tuple(self.instance.get("namespace", []))]
+        if names:
+            result = CPP_DELIM.join(x for x in [result, *names] if x)
 
         assert result, f"No namespace for '{self.name}'!"
         return result
@@ -100,13 +131,12 @@ class GenerateTask(NamedTuple):
     def check_custom_type(self, name: str) -> Optional[TypeLookup]:
         """Check if a name refers to a custom type."""
 
-        final = name.split(CPP_DELIM)[-1]
-
         result = None
-        for gen in Generator:
-            if final in self.config.get(gen.value, {}):
-                result = TypeLookup(name, final, gen)
-                break
+
+        info = self.env.index.get(name)
+        if info is not None and info.generator is not None:
+            result = TypeLookup(name, info.name, info.generator)
+
         return result
 
     def custom_include(self, name: str) -> Optional[Path]:
@@ -114,15 +144,12 @@ class GenerateTask(NamedTuple):
 
         result = None
 
-        lookup = self.check_custom_type(name)
-        if lookup is not None:
+        info = self.env.index.get(name)
+        if info is not None and info.include is not None:
             result = (
-                Path(
-                    "..",
-                    self.env.make_path(lookup.final, lookup.generator),
-                )
-                if lookup.generator != self.generator
-                else Path(f"{lookup.final}.h")
+                Path("..", info.include)
+                if info.generator != self.generator
+                else Path(info.include.name)
             )
 
         return result
@@ -136,6 +163,17 @@ class GenerateTask(NamedTuple):
             + data
         )
 
+    @contextmanager
+    def writer(self, path: Path) -> Iterator[IndentedFileWriter]:
+        """
+        Create a writer for one of this task's output files. Output is
+        rendered in memory and only written to disk if it changed.
+        """
+
+        with StringIO() as stream:
+            yield IndentedFileWriter(stream, per_indent=4)
+            self.env.outputs.write(self.key, path, stream.getvalue())
+
     @contextmanager
     def source_boilerplate(
         self, includes: Iterable[str]
@@ -143,9 +181,7 @@ class GenerateTask(NamedTuple):
         """Create standard generation boilerplate for a source file."""
 
         with ExitStack() as stack:
-            writer = stack.enter_context(
-                IndentedFileWriter.from_path(self.source_path, per_indent=4)
-            )
+            writer = stack.enter_context(self.writer(self.source_path))
 
             self.javadoc_header(writer)
 
@@ -216,9 +252,7 @@ class GenerateTask(NamedTuple):
 
         with ExitStack() as stack:
             writer = stack.enter_context(
-                IndentedFileWriter.from_path(
-                    self.path if not is_test else self.test_path, per_indent=4
-                )
+                self.writer(self.path if not is_test else self.test_path)
             )
 
             # Write file header.
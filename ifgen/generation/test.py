@@ -30,15 +30,12 @@ def unit_test_method(
         f"void {unit_test_method_name(name, task)}(std::endian endianness)"
     )
     with writer.scope():
-        nspace = task.env.types.root_namespace
-
-        project_wide = nspace.namespace(track=False)
+        project_wide = task.env.namespaces[()]
         writer.write(f"using namespace {project_wide};")
 
-        with nspace.pushed(*task.instance.get("namespace", [])):
-            curr = nspace.namespace(track=False)
-            if curr != project_wide:
-                writer.write(f"using namespace {curr};")
+        curr = task.namespace()
+        if curr != project_wide:
+            writer.write(f"using namespace {curr};")
 
         writer.empty()
         yield
@@ -3,14 +3,77 @@ A module exposing some pathing utilities.
 """
 
 # built-in
+from functools import cache
+import os
 from pathlib import Path
+from tempfile import mkstemp
 
 # third-party
 from vcorelib.paths import Pathlike, normalize
 
+# internal
+from ifgen import PKG_NAME
+
 
 def combine_if_not_absolute(root: Path, candidate: Pathlike) -> Path:
     """Combine a root directory with a path if the path isn't absolute."""
 
     candidate = normalize(candidate)
     return candidate if candidate.is_absolute() else root.joinpath(candidate)
+
+
+# Project-local cache directory.
+CACHE_DIR = f".{PKG_NAME}-cache"
+
+CACHE_ENV = f"{PKG_NAME.upper()}_CACHE_DIR"
+
+
+def cache_dir(*parts: str) -> Path:
+    """
+    Get a (user-wide) cache directory for this package, set by environment
+    variable (or following the XDG base-directory specification).
+    """
+
+    root = os.environ.get(CACHE_ENV)
+    if root:
+        return Path(root, *parts)
+
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home().joinpath(".cache")
+    return base.joinpath(PKG_NAME, *parts)
+
+
+@cache
+def default_mode() -> int:
+    """Get the mode that a newly created file would have."""
+
+    # The umask can only be read by setting it.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically, by renaming a temporary file (other processes
+    may be reading the same file).
+    """
+
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = default_mode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(data)
+
+        # Temporary files are only readable by their owner, replaced files
+        # should have the mode that a plain write would result in.
+        os.chmod(temp, mode)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
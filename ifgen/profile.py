@@ -0,0 +1,146 @@
+"""
+A module implementing opt-in, per-phase profiling.
+"""
+
+# built-in
+from cProfile import Profile
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from time import perf_counter_ns, process_time_ns, thread_time_ns
+from typing import Any, Iterator, Optional
+
+# third-party
+from vcorelib.io import ARBITER
+
+PhaseData = dict[str, Any]
+
+
+def to_seconds(nanoseconds: int) -> float:
+    """Convert nanoseconds to seconds."""
+    return nanoseconds / 1e9
+
+
+class PhaseProfiler:
+    """
+    A class for recording wall-clock and CPU time spent in named phases.
+    Phases may nest, and may be recorded concurrently from multiple threads
+    (CPU time is measured per thread).
+    """
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self.phases: dict[str, PhaseData] = {}
+        self.lock = Lock()
+
+        self.start_wall = perf_counter_ns()
+        self.start_cpu = process_time_ns()
+
+    def record(
+        self, name: str, wall_ns: int, cpu_ns: int, key: str = None
+    ) -> None:
+        """Record time spent in a phase (optionally, for a specific item)."""
+
+        with self.lock:
+            data = self.phases.setdefault(
+                name, {"count": 0, "wall": 0.0, "cpu": 0.0}
+            )
+            data["count"] += 1
+            data["wall"] += to_seconds(wall_ns)
+            data["cpu"] += to_seconds(cpu_ns)
+
+            if key is not None:
+                item = data.setdefault("items", {}).setdefault(
+                    key, {"wall": 0.0, "cpu": 0.0}
+                )
+                item["wall"] += to_seconds(wall_ns)
+                item["cpu"] += to_seconds(cpu_ns)
+
+    @contextmanager
+    def phase(self, name: str, key: str = None) -> Iterator[None]:
+        """Record time spent in a phase."""
+
+        wall = perf_counter_ns()
+        cpu = thread_time_ns()
+        try:
+            yield
+        finally:
+            self.record(
+                name,
+                perf_counter_ns() - wall,
+                thread_time_ns() - cpu,
+                key=key,
+            )
+
+    def report(self) -> dict[str, Any]:
+        """Get a report of all recorded phases."""
+
+        phases: dict[str, PhaseData] = {}
+        with self.lock:
+            for name, data in self.phases.items():
+                phases[name] = {
+                    key: value for key, value in data.items() if key != "items"
+                }
+
+                # Sort items from slowest to fastest.
+                if "items" in data:
+                    phases[name]["items"] = dict(
+                        sorted(
+                            data["items"].items(),
+                            key=lambda x: x[1]["wall"],
+                            reverse=True,
+                        )
+                    )
+
+        return {
+            "wall": to_seconds(perf_counter_ns() - self.start_wall),
+            "cpu": to_seconds(process_time_ns() - self.start_cpu),
+            "phases": phases,
+        }
+
+
+PROFILER: Optional[PhaseProfiler] = None
+
+
+@contextmanager
+def phase(name: str, key: str = None) -> Iterator[None]:
+    """Record time spent in a phase (if profiling is enabled)."""
+
+    if PROFILER is None:
+        yield
+    else:
+        with PROFILER.phase(name, key=key):
+            yield
+
+
+@contextmanager
+def profiling(
+    report: Optional[Path], cprofile: Optional[Path] = None
+) -> Iterator[None]:
+    """
+    Enable profiling (if a report path is provided) and write a JSON report
+    (and an optional cProfile dump) when finished.
+    """
+
+    global PROFILER  # pylint: disable=global-statement
+    if report is not None:
+        PROFILER = PhaseProfiler()
+
+    profile = None
+    if cprofile is not None:
+        profile = Profile()
+        profile.enable()
+
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.disable()
+            assert cprofile is not None
+            profile.dump_stats(cprofile)
+
+        if PROFILER is not None:
+            assert report is not None
+            ARBITER.encode(report, PROFILER.report())
+            PROFILER = None
@@ -3,17 +3,207 @@ A module for working with schemas belonging to this package.
 """
 
 # built-in
-from typing import Any, Dict
+from functools import cache
+from hashlib import blake2b
+from importlib.util import module_from_spec, spec_from_file_location
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict
 from typing import Optional as _Optional
+from typing import Type as _Type
 
 # third-party
+import fastjsonschema
 from vcorelib.dict.codec import DictCodec as _DictCodec
-from vcorelib.io import DEFAULT_INCLUDES_KEY
+from vcorelib.io.types import JsonObject as _JsonObject
+from vcorelib.paths import resource
+from vcorelib.schemas.base import Schema as _Schema
 from vcorelib.schemas.base import SchemaMap as _SchemaMap
-from vcorelib.schemas.json import JsonSchemaMap as _JsonSchemaMap
+from vcorelib.schemas.base import SchemaValidationError
+from vcorelib.schemas.json import JsonSchema as _JsonSchema
+from vcorelib.schemas.json import package_handler
 
 # internal
-from ifgen import PKG_NAME
+from ifgen import PKG_NAME, VERSION
+from ifgen.cache import file_digests
+from ifgen.paths import cache_dir, write_atomic
+
+LOG = getLogger(__name__)
+
+Validator = Callable[..., Any]
+Handler = Callable[[str], _JsonObject]
+
+
+def package_schemas() -> Path:
+    """Get the directory containing this package's schemas."""
+
+    result = resource("schemas", package=PKG_NAME, package_subdir="data")
+    assert result is not None
+    return result
+
+
+SCHEMAS = package_schemas()
+
+
+def schema_uri(name: str) -> str:
+    """Get the URI for one of this package's schemas."""
+    return f"package://{PKG_NAME}/schemas/{name}.yaml"
+
+
+@cache
+def schemas_digest() -> str:
+    """
+    Get a digest of this package's schemas (and everything else that
+    generated validator code depends on).
+    """
+
+    hasher = blake2b(
+        f"{VERSION}:{fastjsonschema.VERSION}".encode(), digest_size=20
+    )
+    for path, digest in sorted(file_digests(SCHEMAS.glob("*.yaml")).items()):
+        hasher.update(f"{path}:{digest}".encode())
+    return hasher.hexdigest()
+
+
+def load_validator(name: str, handler: Handler = package_handler) -> Validator:
+    """
+    Load the validator for one of this package's schemas, generating (and
+    caching) its code first if necessary.
+    """
+
+    # Schemas can be compiled with different handlers.
+    key = f"{name}_{handler.__name__}"
+    path = cache_dir("schemas", schemas_digest()).joinpath(f"{key}.py")
+    definition = {"$ref": schema_uri(name)}
+    handlers = {"package": handler}
+
+    if not path.is_file():
+        try:
+            write_atomic(
+                path,
+                fastjsonschema.compile_to_code(
+                    definition, handlers=handlers
+                ).encode(),
+            )
+
+        # The cache directory may not be writable (e.g. a read-only home
+        # directory).
+        except OSError as exc:
+            LOG.debug("Not caching validator '%s' (%s).", key, exc)
+            return fastjsonschema.compile(  # type: ignore
+                definition, handlers=handlers
+            )
+
+    # Importing (rather than executing) generated code also caches its
+    # bytecode.
+    spec = spec_from_file_location(f"{PKG_NAME}_schema_{key}", path)
+    assert spec is not None and spec.loader is not None, path
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate  # type: ignore
+
+
+def struct_handler(uri: str) -> _JsonObject:
+    """
+    Load a referenced schema, leaving struct fields to be validated
+    separately (see 'ConfigSchema').
+    """
+
+    result = package_handler(uri)
+    if uri == schema_uri("Struct"):
+        result["properties"]["fields"] = {"type": "array"}  # type: ignore
+    return result
+
+
+class IfgenSchema(_Schema):
+    """A schema for this package, validated with generated code."""
+
+    def __init__(self, name: str, handler: Handler = package_handler) -> None:
+        """Initialize this schema."""
+
+        super().__init__({"$ref": schema_uri(name)})
+        self.validator = load_validator(name, handler=handler)
+
+    @staticmethod
+    def validate(validator: Validator, data: Any, **kwargs) -> Any:
+        """Validate data with a specific validator."""
+
+        try:
+            return validator(data, **kwargs)
+        except fastjsonschema.JsonSchemaException as exc:
+            raise SchemaValidationError(exc) from exc
+
+    def __call__(self, data: Any) -> Any:
+        """Validate input data and return the result."""
+        return self.validate(self.validator, data)
+
+
+class ConfigSchema(IfgenSchema):
+    """
+    A schema for configurations. Struct fields are validated in a single
+    loop (instead of through each struct's validator), so that context for
+    error messages is only created for invalid fields.
+    """
+
+    def __init__(self, name: str, handler: Handler = struct_handler) -> None:
+        """Initialize this schema."""
+
+        super().__init__(name, handler=handler)
+        self.fields = load_validator("StructField")
+
+    def __call__(self, data: Any) -> Any:
+        """Validate input data and return the result."""
+
+        data = super().__call__(data)
+
+        fields = self.fields
+        for name, struct in data.get("structs", {}).items():
+            for idx, field in enumerate(struct["fields"]):
+                try:
+                    fields(field)
+                except fastjsonschema.JsonSchemaException:
+                    # Validate again, for an error message with the field's
+                    # full path.
+                    self.validate(
+                        fields,
+                        field,
+                        name_prefix=f"data.structs.{name}.fields[{idx}]",
+                    )
+
+        return data
+
+
+SCHEMA_KINDS: Dict[str, _Type[IfgenSchema]] = {"Config": ConfigSchema}
+
+
+class IfgenSchemaMap(_SchemaMap):
+    """
+    A map of this package's schemas, each loaded (from generated code) on
+    first use.
+    """
+
+    @classmethod
+    def kind(cls) -> _Type[_Schema]:
+        """Schemas loaded from other files are compiled when loaded."""
+        return _JsonSchema
+
+    def __contains__(self, name: object) -> bool:
+        """Determine if this map contains a schema."""
+
+        return name in self.data or (
+            isinstance(name, str)
+            and SCHEMAS.joinpath(f"{name}.yaml").is_file()
+        )
+
+    def __missing__(self, name: str) -> _Schema:
+        """Load one of this package's schemas."""
+
+        if name not in self:
+            raise KeyError(name)
+
+        result = SCHEMA_KINDS.get(name, IfgenSchema)(name)
+        self.data[name] = result
+        return result
 
 
 class IfgenDictCodec(_DictCodec):
@@ -23,7 +213,4 @@ class IfgenDictCodec(_DictCodec):
 
     data: Dict[str, Any]
 
-    default_schemas: _Optional[_SchemaMap] = _JsonSchemaMap.from_package(
-        PKG_NAME,
-        includes_key=DEFAULT_INCLUDES_KEY,
-    )
+    default_schemas: _Optional[_SchemaMap] = IfgenSchemaMap()
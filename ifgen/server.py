@@ -0,0 +1,224 @@
+"""
+A module implementing a generation server, which keeps loaded configurations
+and registered types in memory between requests.
+"""
+
+# built-in
+from contextlib import suppress
+import json
+from logging import Formatter, Handler, LogRecord, getLogger
+from pathlib import Path
+import socket
+from socketserver import StreamRequestHandler, TCPServer
+from typing import Any, Optional
+
+# internal
+from ifgen import VERSION
+from ifgen.cache import file_digests
+from ifgen.client import UNIX_SOCKETS
+from ifgen.config import load
+from ifgen.environment import IfgenEnvironment
+from ifgen.environment.outputs import OutputTracker
+from ifgen.generation import generate_environment
+from ifgen.profile import profiling
+
+LOG = getLogger(__name__)
+
+Request = dict[str, Any]
+Response = dict[str, Any]
+
+
+class Project:
+    """A project's loaded configuration and registered types."""
+
+    def __init__(self, root: Path, config: Path) -> None:
+        """Initialize this instance."""
+
+        self.root = root
+        self.config = config
+        self.digests: dict[str, str] = {}
+        self.env: Optional[IfgenEnvironment] = None
+
+    def environment(
+        self, cache: bool = True, jobs: int = 1
+    ) -> IfgenEnvironment:
+        """
+        Get this project's environment, only re-loading the configuration
+        (and re-registering types) if a loaded file changed.
+        """
+
+        if self.env is None or self.digests != file_digests(
+            Path(x) for x in self.digests
+        ):
+            digests: dict[str, str] = {}
+            env = IfgenEnvironment(
+                self.root,
+                load(self.config, cache=cache, jobs=jobs, digests=digests),
+            )
+            self.env = env
+            self.digests = digests
+        else:
+            LOG.info("Re-using loaded configuration '%s'.", self.config)
+
+        return self.env
+
+    def generate(self, request: Request) -> None:
+        """Generate this project's outputs."""
+
+        env = self.environment(
+            cache=not request.get("no_config_cache"),
+            jobs=request.get("jobs"),  # type: ignore
+        )
+
+        # Tasks are created (and track their outputs) on every request.
+        env.outputs = OutputTracker()
+
+        # Generation state is read from (and saved to) the project on every
+        # request, so the 'gen' command can still be used alongside a server.
+        generate_environment(
+            env,
+            force=request.get("force", False),
+            jobs=request.get("jobs"),
+            executor=request.get("executor", "thread"),
+        )
+
+
+class RecordHandler(Handler):
+    """A handler that collects log records (to send to a client)."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        super().__init__()
+        self.setFormatter(Formatter("%(message)s"))
+        self.records: list[tuple[str, int, str]] = []
+
+    def emit(self, record: LogRecord) -> None:
+        """Collect a log record."""
+        self.records.append((record.name, record.levelno, self.format(record)))
+
+
+def handle_request(projects: dict[str, Project], request: Request) -> Response:
+    """Handle a request, returning a response (with any logged messages)."""
+
+    version = request.get("version")
+    if version != VERSION:
+        return {
+            "status": 1,
+            "records": [],
+            "error": f"Client version {version} doesn't match server "
+            f"version {VERSION}.",
+        }
+
+    handler = RecordHandler()
+    root = getLogger()
+    root.addHandler(handler)
+
+    status = 0
+    try:
+        if request.get("command") == "gen":
+            key = f"{request['root']}:{request['config']}"
+            if key not in projects:
+                projects[key] = Project(
+                    Path(request["root"]), Path(request["config"])
+                )
+
+            profile = request.get("profile")
+            cprofile = request.get("cprofile")
+            with profiling(
+                Path(profile) if profile else None,
+                Path(cprofile) if cprofile else None,
+            ):
+                projects[key].generate(request)
+
+    # A failed request (e.g. an invalid configuration) shouldn't stop the
+    # server.
+    except Exception:  # pylint: disable=broad-exception-caught
+        LOG.exception("Request failed.")
+        status = 1
+    finally:
+        root.removeHandler(handler)
+
+    return {"status": status, "records": handler.records}
+
+
+class RequestHandler(StreamRequestHandler):
+    """Handles a single (newline-terminated JSON) request."""
+
+    server: "GenerationServer"
+
+    def handle(self) -> None:
+        """Handle a request."""
+
+        # Connections can be closed without a request (e.g. to check if a
+        # server is listening).
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        request = json.loads(line)
+        response = handle_request(self.server.projects, request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        if request.get("command") == "stop":
+            self.server.running = False
+
+
+def remove_stale(path: Path) -> None:
+    """Remove a socket that no server is listening on."""
+
+    if not path.exists():
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        assert (
+            sock.connect_ex(str(path)) != 0
+        ), f"A server is already listening on '{path}'."
+
+    path.unlink()
+
+
+class GenerationServer(TCPServer):
+    """
+    A server that handles generation requests (one at a time) on a Unix
+    socket.
+    """
+
+    # 'socketserver.UnixStreamServer' isn't defined on platforms without
+    # Unix sockets (so that this module can always be imported).
+    if UNIX_SOCKETS:
+        address_family = socket.AF_UNIX
+
+    def __init__(self, path: Path) -> None:
+        """Initialize this instance."""
+
+        assert UNIX_SOCKETS, "Unix sockets aren't available on this platform!"
+
+        self.path = path
+        self.projects: dict[str, Project] = {}
+        self.running = True
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        remove_stale(path)
+        super().__init__(str(path), RequestHandler)  # type: ignore
+
+    def serve(self) -> None:
+        """Handle requests until stopped."""
+
+        LOG.info("Serving on '%s'.", self.path)
+        with suppress(KeyboardInterrupt):
+            while self.running:
+                self.handle_request()
+
+    def server_close(self) -> None:
+        """Close this server (and remove its socket)."""
+
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def serve(path: Path) -> None:
+    """Handle generation requests on a Unix socket until stopped."""
+
+    with GenerationServer(path) as server:
+        server.serve()
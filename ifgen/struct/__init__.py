@@ -15,7 +15,7 @@ from vcorelib.io.file_writer import (
 
 # internal
 from ifgen import PKG_NAME
-from ifgen.generation.interface import GenerateTask
+from ifgen.generation.interface import GenerateTask, instance_types
 from ifgen.struct.methods import struct_methods
 from ifgen.struct.methods.fields import bit_fields
 from ifgen.struct.source import create_struct_source
@@ -61,23 +61,9 @@ def header_for_type(name: str, task: GenerateTask) -> str:
 def struct_includes(task: GenerateTask) -> Iterable[str]:
     """Determine headers that need to be included for a given struct."""
 
-    result = set()
-    for config in task.instance["fields"]:
-        if "type" in config:
-            result.add(header_for_type(config["type"], task))
-
-        # Add includes for bit-fields.
-        for bit_field in config.get("fields", []):
-            if "type" in bit_field:
-                result.add(header_for_type(bit_field["type"], task))
-
-        # Add includes for alternates.
-        for alternate in config.get("alternates", []):
-            for alternate_bit_field in alternate.get("fields", []):
-                if "type" in alternate_bit_field:
-                    result.add(
-                        header_for_type(alternate_bit_field["type"], task)
-                    )
+    result = set(
+        header_for_type(kind, task) for kind in instance_types(task.instance)
+    )
 
     result.add(f'"../{PKG_NAME}/common.h"')
 
@@ -93,7 +79,7 @@ def struct_fields(task: GenerateTask, writer: IndentedFileWriter) -> None:
         # Fields.
         for field in task.instance["fields"]:
             enforce_expected_size(
-                task.env.size(field["type"]) * field.get("array_length", 1),
+                task.layout.fields[field["name"]].size,
                 field,
                 f"{task.name}.{field['name']}",
             )
@@ -119,9 +105,6 @@ def struct_fields(task: GenerateTask, writer: IndentedFileWriter) -> None:
                     all_fields.extend(field["alternates"])
 
                 for possible_union in all_fields:
-                    if "type" not in possible_union:
-                        possible_union["type"] = field["type"]
-
                     line, comment = struct_line(
                         possible_union["name"],
                         possible_union,
@@ -202,7 +185,7 @@ def create_struct(task: GenerateTask) -> None:
                         )
                     )
 
-                size = task.env.size(task.name)
+                size = task.layout.size
                 enforce_expected_size(size, task.instance, task.name)
 
                 lines.append(
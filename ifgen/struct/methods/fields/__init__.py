@@ -34,7 +34,7 @@ def bit_field(
 ) -> None:
     """Generate for an individual bit-field."""
 
-    type_size = task.env.size(parent["type"]) * 8
+    type_size = task.layout.fields[parent["name"]].element_size * 8
 
     index = field["index"]
     width = field["width"]
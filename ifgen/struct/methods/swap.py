@@ -10,6 +10,7 @@ from typing import Any
 from vcorelib.io import IndentedFileWriter
 
 # internal
+from ifgen.environment.layout import TypeKind
 from ifgen.generation.interface import GenerateTask
 
 
@@ -28,7 +29,7 @@ def no_swap(
 
     kind = field["type"]
 
-    is_enum = task.env.is_enum(kind)
+    is_enum = task.layout.fields[field["name"]].kind is TypeKind.ENUM
 
     if is_decode:
         line = f"{name} = "
@@ -101,7 +102,7 @@ def swap_enum(
 ) -> None:
     """Perform a byte swap for an enumeration type."""
 
-    underlying = task.env.get_enum(field["type"]).primitive + "_t"
+    underlying = f"{task.env.index[field['type']].primitive}_t"
 
     name = field["name"]
     if is_array:
@@ -196,7 +197,8 @@ def swap_fields(
                 writer.write(f"for (std::size_t i = 0; i < {array_cmp}; i++)")
                 stack.enter_context(writer.scope())
 
-            size = task.env.size(kind)
+            layout = task.layout.fields[name]
+            size = layout.element_size
 
             # Handle padding.
             if field["padding"]:
@@ -206,9 +208,9 @@ def swap_fields(
 
             if size == 1:
                 no_swap(field, is_decode, task, writer, is_array)
-            elif task.env.is_struct(kind):
+            elif layout.kind is TypeKind.STRUCT:
                 swap_struct(field, is_decode, task, writer, is_array)
-            elif task.env.is_enum(kind):
+            elif layout.kind is TypeKind.ENUM:
                 swap_enum(field, is_decode, task, writer, is_array)
                 writer.write(f"idx += {size};")
             else:
@@ -2,12 +2,25 @@
 A module implementing interfaces for working with ARM CMSIS-SVD files.
 """
 
+# built-in
+from logging import getLogger
+from pathlib import Path
+
+# third-party
+from vcorelib.paths import find_file
+
 # internal
+from ifgen import PKG_NAME
+from ifgen.config.svd import SvdConfig
 from ifgen.svd.cpu import process_cpu
 from ifgen.svd.device import process_device
+from ifgen.svd.group import base, enums
 from ifgen.svd.peripherals import process_peripheral, process_peripherals
 from ifgen.svd.task import TAG_PROCESSORS
 
+DEFAULT_MIN_ENUM_WIDTH = 2
+DEFAULT_SVD_CONFIG = f"package://{PKG_NAME}/svd.yaml"
+
 
 def register_processors() -> None:
     """Register tag-processing methods."""
@@ -16,3 +29,29 @@ def register_processors() -> None:
     TAG_PROCESSORS["cpu"] = process_cpu
     TAG_PROCESSORS["peripheral"] = process_peripheral
     TAG_PROCESSORS["peripherals"] = process_peripherals
+
+
+def svd_config(path: Path, config: str) -> SvdConfig:
+    """
+    Load SVD-processing configuration and apply its settings for a given SVD
+    file.
+    """
+
+    result = SvdConfig.decode(
+        find_file(config, logger=getLogger(__name__), include_cwd=True)
+    )
+
+    # Only enable certain pruning strategies for certain processors.
+    enable_pruning = path.with_suffix("").name in result.data.setdefault(
+        "enable_pruning", []
+    )
+    enums.PRUNE_ENUMS = enable_pruning
+    base.PRUNE_STRUCTS = enable_pruning
+
+    # Identical enumerations can be emitted once (device-wide) instead of
+    # once per peripheral.
+    enums.SHARE_ENUMS = path.with_suffix("").name in result.data.setdefault(
+        "share_enums", []
+    )
+
+    return result
@@ -0,0 +1,63 @@
+"""
+A module implementing XML-parsing backends for SVD processing.
+"""
+
+# built-in
+from pathlib import Path
+from typing import Iterator
+from xml.etree import ElementTree
+
+# third-party
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: nocover
+    lxml_etree = None
+
+BACKENDS = ["auto", "lxml", "xml"]
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """
+    Resolve a backend name ('auto' prefers 'lxml', if it's installed, over
+    the standard library).
+    """
+
+    assert backend in BACKENDS, f"Unknown backend '{backend}'!"
+
+    if backend == "auto":
+        backend = "xml" if lxml_etree is None else "lxml"
+
+    assert (
+        backend != "lxml" or lxml_etree is not None
+    ), "'lxml' isn't installed!"
+    return backend
+
+
+def parse(path: Path, backend: str = "auto") -> ElementTree.Element:
+    """Parse an entire XML document and return its root element."""
+
+    if resolve_backend(backend) == "lxml":
+        return lxml_etree.parse(  # type: ignore
+            str(path),
+            lxml_etree.XMLParser(huge_tree=True, remove_comments=True),
+        ).getroot()
+
+    return ElementTree.parse(path).getroot()
+
+
+def iterparse(
+    path: Path, tags: tuple[str, ...], backend: str = "auto"
+) -> Iterator[ElementTree.Element]:
+    """
+    Iterate over elements as their end tags are parsed (only elements with
+    specific tags are guaranteed to be produced).
+    """
+
+    if resolve_backend(backend) == "lxml":
+        for _, elem in lxml_etree.iterparse(
+            str(path), tag=tags, huge_tree=True, remove_comments=True
+        ):
+            yield elem
+    else:
+        for _, elem in ElementTree.iterparse(path):
+            yield elem
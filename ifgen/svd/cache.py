@@ -0,0 +1,113 @@
+"""
+A module implementing an on-disk cache of processed SVD models.
+"""
+
+# built-in
+from contextlib import suppress
+from hashlib import blake2b
+from logging import getLogger
+import os
+from pathlib import Path
+from typing import Optional
+
+# internal
+from ifgen import VERSION
+from ifgen.cache import digest_file, read_entry, write_entry
+from ifgen.paths import cache_dir
+from ifgen.profile import phase
+from ifgen.svd.model import SvdModel
+from ifgen.svd.task import SvdProcessingTask
+
+LOG = getLogger(__name__)
+
+SUFFIX = ".model"
+DEFAULT_CACHE_LIMIT = 256 * 1024 * 1024
+
+
+def model_key(path: Path, min_enum_width: int) -> str:
+    """Get a cache key for the model processed from an SVD file."""
+
+    return blake2b(
+        f"{VERSION}:{min_enum_width}:{digest_file(path)}".encode(),
+        digest_size=20,
+    ).hexdigest()
+
+
+def load_model(path: Path) -> Optional[SvdModel]:
+    """Load a cached model (if one exists and can be loaded)."""
+
+    result = read_entry(path, compressed=True)
+    if result is None:
+        return None
+
+    assert isinstance(result, SvdModel), result
+
+    # Entries are evicted least-recently-used first.
+    with suppress(FileNotFoundError):
+        os.utime(path)
+
+    return result
+
+
+def save_model(path: Path, model: SvdModel) -> None:
+    """Write a model to the cache."""
+    write_entry(path, model, compressed=True)
+
+
+def evict(directory: Path, limit: int) -> list[Path]:
+    """
+    Remove the least-recently used cache entries until the total size of all
+    entries is within a limit.
+    """
+
+    entries = []
+    for entry in directory.glob(f"*{SUFFIX}"):
+        with suppress(FileNotFoundError):
+            entries.append((entry.stat(), entry))
+
+    entries.sort(key=lambda x: x[0].st_mtime, reverse=True)
+
+    removed = []
+    total = 0
+    for stat, entry in entries:
+        total += stat.st_size
+        if total > limit:
+            entry.unlink(missing_ok=True)
+            removed.append(entry)
+
+    return removed
+
+
+def cached_svd(
+    path: Path,
+    min_enum_width: int,
+    backend: str = "auto",
+    directory: Path = None,
+    limit: int = DEFAULT_CACHE_LIMIT,
+) -> SvdProcessingTask:
+    """
+    Process an SVD file, re-using a previously processed model (keyed by the
+    file's contents, this package's version and the minimum enumeration
+    width) if possible.
+    """
+
+    if directory is None:
+        directory = cache_dir("svd")
+
+    entry = directory.joinpath(model_key(path, min_enum_width) + SUFFIX)
+
+    with phase("svd.cache", key="load"):
+        model = load_model(entry)
+
+    if model is not None:
+        LOG.info("Loaded cached model for '%s' ('%s').", path, entry)
+        return SvdProcessingTask(model, min_enum_width)
+
+    task = SvdProcessingTask.svd(path, min_enum_width, backend=backend)
+
+    with phase("svd.cache", key="save"):
+        save_model(entry, task.model)
+        for removed in evict(directory, limit):
+            LOG.info("Evicted cached model '%s'.", removed)
+
+    return task
@@ -6,10 +6,8 @@ A module implementing interfaces for processing a group of peripherals.
 from pathlib import Path
 from typing import Any
 
-# third-party
-from vcorelib.io import ARBITER
-
 # internal
+from ifgen.profile import phase
 from ifgen.svd.group.base import PeripheralGroup, peripheral_groups
 from ifgen.svd.group.fields import (
     DEFAULT_STRUCT,
@@ -19,7 +17,13 @@ from ifgen.svd.group.fields import (
 )
 from ifgen.svd.model.peripheral import Peripheral
 
-__all__ = ["PeripheralGroup", "peripheral_groups", "handle_group"]
+__all__ = [
+    "PeripheralGroup",
+    "peripheral_groups",
+    "handle_group",
+    "handle_shared_enums",
+    "GroupOutput",
+]
 
 
 def struct_instance(peripheral: Peripheral) -> dict[str, Any]:
@@ -60,20 +64,35 @@ def struct_data(
     return data
 
 
+GroupOutput = tuple[Path, dict[str, Any]]
+
+
 def handle_group(
     output_dir: Path,
     group: PeripheralGroup,
-    includes: set[Path],
     min_enum_members: int,
-) -> None:
-    """Handle a peripheral group."""
+    shared_enums: EnumMap = None,
+) -> GroupOutput:
+    """
+    Handle a peripheral group (get its include file and data). Enumerations
+    are part of the group's data unless a (device-wide) shared mapping is
+    provided.
+    """
 
-    output = output_dir.joinpath("include.yaml")
-    includes.add(output)
+    name = group.root.base_name()
 
     structs: StructMap = {}
-    enums: EnumMap = {}
-    structs[group.root.base_name()] = struct_data(
-        group, structs, enums, min_enum_members
-    )
-    ARBITER.encode(output, {"structs": structs, "enums": enums})
+    enums: EnumMap = {} if shared_enums is None else shared_enums
+    with phase("svd.process", key=name):
+        structs[name] = struct_data(group, structs, enums, min_enum_members)
+
+    data: dict[str, Any] = {"structs": structs}
+    if shared_enums is None:
+        data["enums"] = enums
+
+    return output_dir.joinpath("include.yaml"), data
+
+
+def handle_shared_enums(output_dir: Path, enums: EnumMap) -> GroupOutput:
+    """Get the include file and data for enumerations shared by groups."""
+    return output_dir.joinpath("include.yaml"), {"enums": enums}
@@ -28,27 +28,31 @@ PRUNE_STRUCTS = False
 
 
 def get_derived(
-    peripheral: Peripheral, peripherals: list[Peripheral]
+    peripheral: Peripheral, candidates: dict[int, list[Peripheral]]
 ) -> Optional[Peripheral]:
-    """Determine if this peripheral is derived from any other peripheral."""
+    """
+    Determine if this peripheral is derived from any other peripheral.
+    Candidates (earlier peripherals that others may be equivalent to) are
+    bucketed by structural fingerprint, so full comparisons only happen when
+    fingerprints match.
+    """
 
     result = None
 
     if peripheral.derived:
-        result = peripheral.derived_elem
+        result = peripheral.derived_root
 
     # Check if this peripheral is equivalent to some other peripheral.
     elif PRUNE_STRUCTS:
-        for other in peripherals:
-            # Always return None if you get far enough to see yourself in the
-            # list. That way this peripheral becomes the effective 'root'.
-            if other is peripheral:
+        bucket = candidates.setdefault(peripheral.fingerprint, [])
+        for other in bucket:
+            if other == peripheral:
+                result = other
                 break
 
-            if not other.is_alternate() and not other.derived:
-                if other == peripheral:
-                    result = other
-                    break
+        # This peripheral is a candidate for any that come after it.
+        if not peripheral.is_alternate():
+            bucket.append(peripheral)
 
     return result
 
@@ -59,12 +63,12 @@ def peripheral_groups(
     """Organize peripherals into groups."""
 
     result: dict[str, PeripheralGroup] = {}
+    candidates: dict[int, list[Peripheral]] = {}
 
-    peripherals_list = list(peripherals[x] for x in sorted(peripherals))
-    for peripheral in peripherals_list:
+    for peripheral in (peripherals[x] for x in sorted(peripherals)):
         name = peripheral.base_name()
 
-        derived = get_derived(peripheral, peripherals_list)
+        derived = get_derived(peripheral, candidates)
         if derived is not None:
             name = derived.base_name()
 
@@ -3,6 +3,7 @@ A module for handling SVD bit-field enumerations.
 """
 
 # built-in
+from hashlib import blake2b
 from os.path import commonprefix
 from typing import Any
 
@@ -17,28 +18,43 @@ ENUM_DEFAULTS: dict[str, Any] = {
     "identifier": False,
 }
 
-BY_HASH: dict[str, dict[int, str]] = {}
+BY_DIGEST: dict[str, dict[str, str]] = {}
 PRUNE_ENUMS = False
+SHARE_ENUMS = False
 
 
-def get_enum_name(name: str, peripheral: str, raw_mapping: EnumValues) -> str:
-    """Get the name of an enumeration."""
+def enum_digest(data: EnumValues) -> str:
+    """
+    Get a digest of an enumeration's values (and underlying type). Unlike
+    hash(), this is stable across processes.
+    """
 
-    if not PRUNE_ENUMS:
-        return name
-
-    hashed = hash(
+    return blake2b(
         ",".join(
-            name + f"={val['value']}" for name, val in raw_mapping.items()
-        )
-    )
+            [data.get("underlying", "")]
+            + [f"{name}={val['value']}" for name, val in data["enum"].items()]
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def get_enum_name(name: str, peripheral: str, data: EnumValues) -> str:
+    """
+    Get the name of an enumeration (the first name interned with identical
+    values, per peripheral or device-wide when sharing).
+    """
+
+    if not PRUNE_ENUMS and not SHARE_ENUMS:
+        return name
 
-    BY_HASH.setdefault(peripheral, {})
+    return BY_DIGEST.setdefault(
+        "" if SHARE_ENUMS else peripheral, {}
+    ).setdefault(enum_digest(data), name)
 
-    for_periph = BY_HASH[peripheral]
-    for_periph.setdefault(hashed, name)
 
-    return for_periph[hashed]
+def reset_enums() -> None:
+    """Forget all interned enumeration names."""
+    BY_DIGEST.clear()
 
 
 IGNORE_WORDS = {
@@ -135,7 +135,7 @@ def process_bit_fields(
                 enum_name = get_enum_name(
                     sanitize_name(f"{peripheral}_{register.name}_{name}"),
                     peripheral,
-                    raw,
+                    new_enum,
                 )
                 field_data["type"] = enum_name
                 if enum_name not in enums:
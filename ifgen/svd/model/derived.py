@@ -4,7 +4,8 @@ attribute.
 """
 
 # built-in
-from typing import Iterable, Iterator, Optional, TypeVar
+from collections import deque
+from typing import Container, Iterable, Optional, TypeVar
 from xml.etree import ElementTree
 
 # third-party
@@ -29,6 +30,15 @@ class DerivedMixin(StringKeyValueMixin):
             result = self
         return result
 
+    @property
+    def derived_root(self: T) -> T:
+        """Get the element at the root of this instance's derivation chain."""
+
+        result = self
+        while result.derived:
+            result = result.derived_elem
+        return result
+
     @property
     def name(self) -> str:
         """Get the name of this peripheral."""
@@ -70,20 +80,81 @@ class DerivedMixin(StringKeyValueMixin):
             )
 
 
-def derived_from_stack(
-    elements: Iterable[ElementTree.Element],
-) -> Iterator[ElementTree.Element]:
-    """Organize elements that are derived after ones that aren't."""
-
-    elem_stack = []
+def derived_order(
+    elements: Iterable[ElementTree.Element], known: Container[str] = ()
+) -> list[ElementTree.Element]:
+    """
+    Order elements such that each one comes after the element (by name) it's
+    derived from. Elements otherwise keep their relative order. Bases may also
+    be names that are already known (i.e. processed previously).
+    """
+
+    items = list(elements)
+    names = [x.findtext("name", "") for x in items]
+
+    result: list[ElementTree.Element] = []
+    emitted: set[str] = set()
+    waiting: dict[str, list[int]] = {}
+
+    ready: deque[int] = deque()
+    for idx, item in enumerate(items):
+        base = item.attrib.get("derivedFrom")
+        if base is not None and base not in emitted and base not in known:
+            waiting.setdefault(base, []).append(idx)
+            continue
+
+        # Emit this element and anything (transitively) waiting on it.
+        ready.append(idx)
+        while ready:
+            current = ready.popleft()
+            result.append(items[current])
+            emitted.add(names[current])
+            ready.extend(waiting.pop(names[current], []))
+
+    assert not waiting, unresolved(items, names, waiting)
+    return result
+
+
+def unresolved(
+    items: list[ElementTree.Element],
+    names: list[str],
+    waiting: dict[str, list[int]],
+) -> str:
+    """Describe 'derivedFrom' references that couldn't be resolved."""
+
+    present = set(names)
+    for base, indices in waiting.items():
+        if base not in present:
+            derived = ", ".join(f"'{names[x]}'" for x in indices)
+            return f"{derived} derived from unknown '{base}'!"
+
+    # Everything left is part of (or derived from) a cycle, find one.
+    bases = {
+        name: items[idx].attrib.get("derivedFrom", "")
+        for idx, name in enumerate(names)
+    }
+    name = names[next(iter(waiting.values()))[0]]
+    path: list[str] = []
+    while name not in path:
+        path.append(name)
+        name = bases[name]
+
+    cycle = path[path.index(name) :] + [name]
+    return "Cycle in 'derivedFrom' references: " + " -> ".join(
+        f"'{x}'" for x in cycle
+    )
 
-    for elem in elements:
-        # Handle derived peripherals last.
-        derived = elem.attrib.get("derivedFrom")
-        if derived is not None:
-            elem_stack.append(elem)
-        else:
-            elem_stack.insert(0, elem)
 
-    while elem_stack:
-        yield elem_stack.pop(0)
+def derived_from_stack(
+    elements: Iterable[ElementTree.Element],
+) -> list[ElementTree.Element]:
+    """
+    Organize elements that are derived after ones that aren't (elements that
+    aren't derived are produced in reverse order).
+    """
+
+    items = list(elements)
+    return derived_order(
+        [x for x in reversed(items) if "derivedFrom" not in x.attrib]
+        + [x for x in items if "derivedFrom" in x.attrib]
+    )
@@ -40,6 +40,18 @@ class Field(DerivedMixin):
 
         return result
 
+    @property
+    def fingerprint(self) -> int:
+        """
+        Get a structural hash of this field (equivalent fields have the same
+        fingerprint).
+        """
+
+        data = self.ifgen_data
+        return hash(
+            (data["index"], data["width"], data["read"], data["write"])
+        )
+
     @property
     def access(self) -> str:
         """Get this instance's access property."""
@@ -29,10 +29,17 @@ class Cluster(DerivedMixin):
     def __eq__(self, other) -> bool:
         """Determine if two clusers are equivalent."""
 
-        return isinstance(other, Cluster) and all(
-            x == y for x, y in zip(self.children, other.children)
+        return (
+            isinstance(other, Cluster)
+            and len(self.children) == len(other.children)
+            and all(x == y for x, y in zip(self.children, other.children))
         )
 
+    @property
+    def fingerprint(self) -> int:
+        """Get a structural hash of this cluster."""
+        return hash(("cluster", tuple(x.fingerprint for x in self.children)))
+
     @classmethod
     def string_keys(cls) -> Iterable[StringKeyVal]:
         """Get string keys for this instance type."""
@@ -64,6 +71,16 @@ def fields_equal(left: Optional[FieldMap], right: Optional[FieldMap]) -> bool:
     return result
 
 
+def fields_fingerprint(fields: Optional[FieldMap]) -> Optional[int]:
+    """Get a structural hash of a field map (independent of field order)."""
+
+    return (
+        hash(frozenset((key, val.fingerprint) for key, val in fields.items()))
+        if fields is not None
+        else None
+    )
+
+
 @dataclass
 class Register(DerivedMixin):
     """A container for register information."""
@@ -79,6 +96,11 @@ class Register(DerivedMixin):
             self.fields, other.fields
         )
 
+    @property
+    def fingerprint(self) -> int:
+        """Get a structural hash of this register."""
+        return hash(("register", fields_fingerprint(self.fields)))
+
     @property
     def bits(self) -> int:
         """Get the size of this register in bits."""
@@ -183,8 +205,20 @@ class Peripheral(DerivedMixin):
     def __eq__(self, other) -> bool:
         """Determine if two peripherals are equivalent."""
 
-        return isinstance(other, Peripheral) and all(
-            x == y for x, y in zip(self.registers, other.registers)
+        return (
+            isinstance(other, Peripheral)
+            and len(self.registers) == len(other.registers)
+            and all(x == y for x, y in zip(self.registers, other.registers))
+        )
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        Get a structural hash of this peripheral (equivalent peripherals have
+        the same fingerprint).
+        """
+        return hash(
+            ("peripheral", tuple(x.fingerprint for x in self.registers))
         )
 
     @property
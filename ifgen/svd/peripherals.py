@@ -52,4 +52,4 @@ def process_peripherals(
     del logger
 
     for item in derived_from_stack(elem.iterfind("peripheral")):
-        task.process(item)
+        task.process_peripheral(item)
@@ -6,6 +6,7 @@ A module implementing interfaces for processing registers and clusters.
 from xml.etree import ElementTree
 
 # internal
+from ifgen.svd.model.derived import derived_order
 from ifgen.svd.model.field import get_fields
 from ifgen.svd.model.peripheral import (
     Cluster,
@@ -26,24 +27,24 @@ def handle_registers(
 ) -> RegisterData:
     """Handle the 'registers' element."""
 
-    result: RegisterData = []
-
     if cluster_map is None:
         cluster_map = {}
     if register_map is None:
         register_map = {}
 
-    for item in registers:
-        if item.tag == "cluster":
-            result.append(
-                cluster(
-                    item, cluster_map, peripheral, register_map=register_map
-                )
-            )
-        elif item.tag == "register":
-            result.append(register(item, register_map, peripheral))
-
-    return result
+    items = [x for x in registers if x.tag in {"cluster", "register"}]
+
+    # Process elements after the ones they're derived from, but keep document
+    # order in the result.
+    created: dict[int, Register | Cluster] = {}
+    for item in derived_order(items, known={*register_map, *cluster_map}):
+        created[id(item)] = (
+            cluster(item, cluster_map, peripheral, register_map=register_map)
+            if item.tag == "cluster"
+            else register(item, register_map, peripheral)
+        )
+
+    return [created[id(x)] for x in items]
 
 
 def cluster(
@@ -5,7 +5,8 @@ A module implementing interfaces for string-data elements.
 # built-in
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Type, TypeVar
+from functools import cache
+from typing import Any, Callable, Iterable, Optional, Type, TypeVar
 from xml.etree import ElementTree
 
 # third-party
@@ -21,6 +22,7 @@ class StringKeyVal:
 
 
 T = TypeVar("T", bound="StringKeyValueMixin")
+StringValuesExtractor = Callable[[ElementTree.Element], dict[str, str]]
 
 
 class StringKeyValueMixin(ABC):
@@ -82,26 +84,50 @@ class StringKeyValueMixin(ABC):
     @classmethod
     def get_values(cls, elem: ElementTree.Element) -> dict[str, str]:
         """Get string values for this instance."""
+        return string_extractor(cls)(elem)
 
-        return get_string_values(elem, cls.string_keys())
 
+def string_values_extractor(
+    keys: Iterable[StringKeyVal],
+) -> StringValuesExtractor:
+    """
+    Create a function that gets string values (for specific keys) from an
+    element's children, with a single pass over them.
+    """
 
-def get_string_values(
-    elem: ElementTree.Element, keys: Iterable[StringKeyVal]
-) -> dict[str, str]:
-    """Get string values from an element's children."""
+    items = list(keys)
+    names = [x.key for x in items]
+    wanted = frozenset(names)
+    required = [x.key for x in items if x.required]
+
+    def extract(elem: ElementTree.Element) -> dict[str, str]:
+        """Get string values from an element's children."""
+
+        found: dict[str, str] = {}
+        for child in elem:
+            tag = child.tag
+            if tag in wanted and tag not in found:
+                found[tag] = child.text or ""
+
+        for key in required:
+            assert key in found, f"'{key}' required but not found!"
 
-    result = {}
+        # Keep the order that keys are declared in.
+        return {key: found[key] for key in names if key in found}
 
-    for item in keys:
-        key = item.key
-        required = item.required
+    return extract
 
-        new_elem = elem.find(key)
-        assert (
-            new_elem is not None or not required
-        ), f"'{key}' required but not found!"
-        if new_elem is not None:
-            result[key] = new_elem.text or ""
 
-    return result
+@cache
+def string_extractor(
+    cls: Type[StringKeyValueMixin],
+) -> StringValuesExtractor:
+    """Get a (cached) string-value extractor for a class."""
+    return string_values_extractor(cls.string_keys())
+
+
+def get_string_values(
+    elem: ElementTree.Element, keys: Iterable[StringKeyVal]
+) -> dict[str, str]:
+    """Get string values from an element's children."""
+    return string_values_extractor(keys)(elem)
@@ -5,25 +5,41 @@ A module implementing an SVD-processing task interface.
 # built-in
 from dataclasses import dataclass
 from logging import getLogger
+from multiprocessing import Pool
+from os import cpu_count
 from pathlib import Path
-from typing import Callable, Iterable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 from xml.etree import ElementTree
 
 # third-party
-from vcorelib.io import ARBITER
+from vcorelib.dict import merge
+from vcorelib.io import ARBITER, DEFAULT_INCLUDES_KEY
 from vcorelib.logging import LoggerType
 from vcorelib.paths import rel
 
 # internal
+from ifgen.config import from_data
 from ifgen.config.svd import SvdConfig
-from ifgen.svd.group import handle_group, peripheral_groups
+from ifgen.generation import generate
+from ifgen.profile import phase
+from ifgen.svd.backend import iterparse, parse
+from ifgen.svd.group import (
+    GroupOutput,
+    enums,
+    handle_group,
+    handle_shared_enums,
+    peripheral_groups,
+)
+from ifgen.svd.group.fields import EnumMap
 from ifgen.svd.model import SvdModel
+from ifgen.svd.model.derived import derived_order
 
 TagProcessor = Callable[
     [ElementTree.Element, "SvdProcessingTask", LoggerType], None
 ]
 TagProcessorMap = dict[str, TagProcessor]
 TAG_PROCESSORS: TagProcessorMap = {}
+SHARED_ENUMS_DIR = "shared_enums"
 
 
 def filter_includes(
@@ -53,6 +69,33 @@ def filter_includes(
             yield item
 
 
+def emit_output(output: GroupOutput) -> None:
+    """Encode a single output file."""
+
+    path, data = output
+    with phase("svd.emit", key=path.parent.name):
+        ARBITER.encode(path, data)
+
+
+def emit_outputs(outputs: list[GroupOutput], jobs: int = None) -> None:
+    """Encode output files, in worker processes if requested."""
+
+    if jobs is None:
+        jobs = cpu_count() or 1
+
+    if jobs <= 1 or len(outputs) <= 1:
+        for output in outputs:
+            emit_output(output)
+        return
+
+    # Output data is plain (picklable) data, phases are only recorded for
+    # the pool as a whole.
+    with phase("svd.emit", key=f"pool ({jobs} jobs)"):
+        with Pool(jobs) as pool:
+            for _ in pool.imap_unordered(emit_output, outputs):
+                pass
+
+
 @dataclass
 class SvdProcessingTask:
     """A container for SVD-processing state."""
@@ -64,47 +107,114 @@ class SvdProcessingTask:
         """Process a single element."""
         TAG_PROCESSORS[elem.tag](elem, self, getLogger(elem.tag))
 
+    def process_peripheral(self, elem: ElementTree.Element) -> None:
+        """Process a single peripheral element."""
+
+        with phase("svd.peripheral", key=elem.findtext("name")):
+            self.process(elem)
+
     @staticmethod
-    def svd(path: Path, min_enum_width: int) -> "SvdProcessingTask":
+    def svd(
+        path: Path,
+        min_enum_width: int,
+        stream: bool = True,
+        backend: str = "auto",
+    ) -> "SvdProcessingTask":
         """Process a single SVD file."""
 
         task = SvdProcessingTask(SvdModel({}), min_enum_width)
-        task.process(ElementTree.parse(path).getroot())
+
+        with phase("svd.parse"):
+            if stream:
+                task.stream(path, backend=backend)
+            else:
+                task.process(parse(path, backend=backend))
+
         return task
 
-    def generate_configs(self, path: Path, config: SvdConfig) -> None:
-        """Generate output configuration files."""
+    def stream(self, path: Path, backend: str = "auto") -> None:
+        """
+        Process a single SVD file incrementally. Peripherals are processed
+        (and their elements discarded) as soon as they're parsed, peripherals
+        derived from other peripherals are processed after all others.
+        """
 
-        path.mkdir(exist_ok=True, parents=True)
+        derived: list[ElementTree.Element] = []
+
+        for elem in iterparse(
+            path, ("peripheral", "peripherals", "device"), backend=backend
+        ):
+            tag = elem.tag
+
+            if tag == "peripheral":
+                if "derivedFrom" in elem.attrib:
+                    derived.append(elem)
+                else:
+                    self.process_peripheral(elem)
+                    elem.clear()
+
+            elif tag == "peripherals":
+                for item in derived_order(
+                    derived, known=self.model.peripherals
+                ):
+                    self.process_peripheral(item)
+                derived = []
+                elem.clear()
+
+            # Process device and CPU data (peripherals are already handled).
+            elif tag == "device":
+                self.process(elem)
 
-        includes: set[Path] = set()
+    def configs(self, path: Path, config: SvdConfig) -> "SvdOutputs":
+        """Create configuration data for an output directory."""
+
+        # Enumeration names are interned per output.
+        enums.reset_enums()
+        shared: EnumMap | None = {} if enums.SHARE_ENUMS else None
 
         # Organize peripherals into groups based on ones derived from others
-        # and process them.
-        for group in peripheral_groups(self.model.peripherals).values():
-            output_dir = path.joinpath(group.root.base_name())
-            output_dir.mkdir(exist_ok=True)
-            handle_group(output_dir, group, includes, self.min_enum_width)
+        # and process them (serially, so that enumeration interning is
+        # deterministic).
+        with phase("svd.group"):
+            groups = peripheral_groups(self.model.peripherals)
+        assert SHARED_ENUMS_DIR not in groups, SHARED_ENUMS_DIR
+
+        outputs: list[GroupOutput] = []
+        for group in groups.values():
+            outputs.append(
+                handle_group(
+                    path.joinpath(group.root.base_name()),
+                    group,
+                    self.min_enum_width,
+                    shared,
+                )
+            )
+
+        if shared is not None:
+            outputs.append(
+                handle_shared_enums(path.joinpath(SHARED_ENUMS_DIR), shared)
+            )
 
-        # Write metadata that doesn't currently get used for generation.
+        # Metadata that doesn't currently get used for generation.
         meta = self.model.metadata()
 
         # Indicate includes that were filtered out in metadata.
         filtered: dict[str, str] = {}
         meta["filtered_includes"] = filtered
 
-        ARBITER.encode(
-            path.joinpath("ifgen.yaml"),
+        return SvdOutputs(
+            path,
+            outputs,
             {
-                "includes": sorted(  # type: ignore
+                DEFAULT_INCLUDES_KEY: sorted(
                     filter_includes(
                         config,
                         self.model,
-                        (rel(x.resolve(), base=path) for x in includes),
+                        (rel(x.resolve(), base=path) for x, _ in outputs),
                         filtered,
                     )
                 ),
-                "namespace": self.model.namespace(),  # type: ignore
+                "namespace": self.model.namespace(),
                 "struct": {
                     "stream": False,
                     "codec": False,
@@ -114,5 +224,97 @@ class SvdProcessingTask:
                 },
                 "enum": {"use_map": False, "identifier": False},
             },
+            meta,
+            filtered,
         )
-        ARBITER.encode(path.joinpath("metadata.json"), meta)
+
+    def generate_configs(
+        self, path: Path, config: SvdConfig, jobs: int = 1
+    ) -> dict[str, str]:
+        """
+        Generate output configuration files (encoding files with parallel
+        jobs, if requested). Returns includes that were filtered out (and
+        why).
+        """
+
+        path.mkdir(exist_ok=True, parents=True)
+
+        outputs = self.configs(path, config)
+        outputs.write(jobs=jobs)
+        return outputs.filtered
+
+    def generate_code(
+        self,
+        path: Path,
+        config: SvdConfig,
+        jobs: int = 1,
+        write_configs: bool = False,
+    ) -> dict[str, str]:
+        """
+        Generate code for an output directory directly from configuration data
+        (configuration files are only written if requested). Returns includes
+        that were filtered out (and why).
+        """
+
+        path.mkdir(exist_ok=True, parents=True)
+
+        outputs = self.configs(path, config)
+        if write_configs:
+            outputs.write(jobs=jobs)
+        else:
+            outputs.write_metadata()
+
+        generate(path.resolve(), from_data(outputs.config_data()), jobs=jobs)
+        return outputs.filtered
+
+
+@dataclass
+class SvdOutputs:
+    """Configuration data created from an SVD model."""
+
+    path: Path
+    includes: list[GroupOutput]
+    config: dict[str, Any]
+    metadata: dict[str, Any]
+    filtered: dict[str, str]
+
+    def write(self, jobs: int = 1) -> None:
+        """Write configuration files (and metadata)."""
+
+        # Encoding is the bulk of the work (and outputs are independent).
+        for output, _ in self.includes:
+            output.parent.mkdir(exist_ok=True)
+        emit_outputs(self.includes, jobs=jobs)
+
+        with phase("svd.emit", key="ifgen.yaml"):
+            ARBITER.encode(self.path.joinpath("ifgen.yaml"), self.config)
+
+        self.write_metadata()
+
+    def write_metadata(self) -> None:
+        """Write metadata that doesn't currently get used for generation."""
+
+        with phase("svd.emit", key="metadata.json"):
+            ARBITER.encode(self.path.joinpath("metadata.json"), self.metadata)
+
+    def config_data(self) -> dict[str, Any]:
+        """
+        Get configuration data equivalent to loading the top-level
+        configuration file (and its includes). Include data is merged in
+        place, so any configuration files should be written first.
+        """
+
+        by_name = {
+            str(rel(x.resolve(), base=self.path)): data
+            for x, data in self.includes
+        }
+
+        result = {
+            key: value
+            for key, value in self.config.items()
+            if key != DEFAULT_INCLUDES_KEY
+        }
+        for include in self.config[DEFAULT_INCLUDES_KEY]:
+            merge(result, by_name[include])
+
+        return result
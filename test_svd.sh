@@ -11,15 +11,13 @@ do_test() {
 	PKG=ifgen
 	IG=../../venv/bin/ig
 
+	# Process every SVD file with one command (outputs go in per-chip
+	# directories).
+	SVDS=()
 	for CHIP in "${CHIPS[@]}"; do
-		mkdir -p "$CHIP/$PKG"
-		$IG svd -o "$CHIP/$PKG" "package://$PKG/svd/$CHIP.svd" &
-		ENTRY="$CHIP/$PKG.yaml"
-		echo "---" > "$ENTRY"
-		echo "includes:" >> "$ENTRY"
-		echo "  - $PKG/$PKG.yaml" >> "$ENTRY"
+		SVDS+=("package://$PKG/svd/$CHIP.svd")
 	done
-	wait
+	$IG svd -o . --report svd.json "${SVDS[@]}"
 
 	for CHIP in "${CHIPS[@]}"; do
 		$IG -C "$CHIP" gen &
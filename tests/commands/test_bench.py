@@ -0,0 +1,74 @@
+"""
+Test the 'commands.bench' module.
+"""
+
+# built-in
+from pathlib import Path
+from typing import Any
+
+# third-party
+from vcorelib.io import ARBITER
+
+# module under test
+from ifgen import PKG_NAME
+from ifgen.bench import PHASES
+from ifgen.entry import main as ifgen_main
+
+
+def test_bench_command_basic(tmp_path: Path):
+    """Test the 'bench' command."""
+
+    output = tmp_path.joinpath("bench.json")
+    baseline = tmp_path.joinpath("baseline.json")
+
+    # Any measurement should regress relative to this baseline.
+    report: dict[str, Any] = {
+        "results": {"rp2040": {x: {"time": 0.0} for x in PHASES}}
+    }
+    ARBITER.encode(baseline, report)
+
+    args = [PKG_NAME, "bench", "-r", "1", "--no-memory", "-o", str(output)]
+    svd = f"package://{PKG_NAME}/svd/rp2040.svd"
+
+    assert ifgen_main(args + ["-B", str(baseline), svd]) == 1
+
+    data: dict[str, Any] = ARBITER.decode(output, require_success=True).data
+    assert set(data["results"]["rp2040"]) == set(PHASES)
+
+    # Results shouldn't regress relative to themselves.
+    assert ifgen_main(args + ["-B", str(output), "-t", "10", svd]) == 0
+
+
+def test_bench_command_scale(tmp_path: Path):
+    """Test the 'bench' command with synthetic devices."""
+
+    output = tmp_path.joinpath("bench.json")
+    csv = tmp_path.joinpath("bench.csv")
+
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "bench",
+                "-r",
+                "1",
+                "--no-memory",
+                "-o",
+                str(output),
+                "--csv",
+                str(csv),
+                "--scale",
+                "peripherals=1,2",
+            ]
+        )
+        == 0
+    )
+
+    result: dict[str, Any] = ARBITER.decode(output, require_success=True).data
+    assert result["parameter"] == "peripherals"
+    assert set(result["results"]) == {"1", "2"}
+
+    with csv.open(encoding="utf-8") as path_fd:
+        rows = path_fd.read().splitlines()
+    assert rows[0] == "peripherals,phase,metric,value"
+    assert len(rows) == 1 + 2 * len(PHASES)
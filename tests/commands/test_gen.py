@@ -3,6 +3,7 @@ Test the 'commands.gen' module.
 """
 
 # built-in
+from pathlib import Path
 from subprocess import run
 from sys import executable, platform
 from typing import Any
@@ -15,7 +16,7 @@ from ifgen import PKG_NAME
 from ifgen.entry import main as ifgen_main
 
 # internal
-from tests.resources import clean_scenario
+from tests.resources import clean_scenario, copy_scenario
 
 
 def test_ifgen_command_basic():
@@ -43,3 +44,83 @@ def test_ifgen_command_basic():
             for variant in ["debug", "clang"]:
                 if name in tests:
                     run([data["variants"][variant]], check=True)
+
+
+def test_ifgen_command_incremental(tmp_path: Path):
+    """Test that the 'gen' command only regenerates outputs that changed."""
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+    assert ifgen_main([PKG_NAME, "gen", "-r", str(path)]) == 0
+
+    output = path.joinpath("src", "generated")
+    outputs = {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+    assert outputs
+
+    # Nothing changed, so nothing should be re-written.
+    assert ifgen_main([PKG_NAME, "gen", "-r", str(path)]) == 0
+    assert outputs == {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+
+    # Remove a struct, its outputs should be removed.
+    config = path.joinpath("ifgen.yaml")
+    data: dict[str, Any] = ARBITER.decode(config, require_success=True).data
+    del data["structs"]["TestPadding"]
+    ARBITER.encode(config, data)
+
+    assert ifgen_main([PKG_NAME, "gen", "-r", str(path)]) == 0
+    assert not output.joinpath("structs", "TestPadding.h").exists()
+    assert output.joinpath("structs", "Test1.h").is_file()
+
+    # Change a struct used as a field, its dependents should be re-generated.
+    contents = {x: x.read_bytes() for x in output.rglob("*.*")}
+    data["structs"]["Test2"]["fields"][0]["type"] = "int32_t"
+    ARBITER.encode(config, data)
+
+    assert ifgen_main([PKG_NAME, "gen", "-r", str(path)]) == 0
+    changed = {
+        str(x.relative_to(output))
+        for x, content in contents.items()
+        if x.read_bytes() != content
+    }
+    assert {"structs/Test2.h", "structs/Test3.h"} <= changed
+    assert "structs/Test1.h" not in changed
+
+    # Regenerate everything, unchanged files shouldn't be re-written.
+    outputs = {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+    assert ifgen_main([PKG_NAME, "gen", "-f", "-r", str(path)]) == 0
+    assert outputs == {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+
+    # Worker processes should produce identical outputs.
+    args = [PKG_NAME, "gen", "-f", "-j", "2", "-e", "process"]
+    assert ifgen_main(args + ["-r", str(path)]) == 0
+    assert outputs == {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+
+
+def test_ifgen_command_profile(tmp_path: Path):
+    """Test the 'gen' command's profiling options."""
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+
+    report = tmp_path.joinpath("profile.json")
+    stats = tmp_path.joinpath("profile.prof")
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "gen",
+                "-r",
+                str(path),
+                "--profile",
+                str(report),
+                "--cprofile",
+                str(stats),
+            ]
+        )
+        == 0
+    )
+    assert stats.is_file()
+
+    data: dict[str, Any] = ARBITER.decode(report, require_success=True).data
+    phases = data["phases"]
+    for name in ["config.load", "register.structs", "write"]:
+        assert phases[name]["count"] > 0
+    assert "structs/Test1" in phases["generate.create_struct"]["items"]
@@ -0,0 +1,124 @@
+"""
+Test the 'commands.serve' and 'commands.client' modules.
+"""
+
+# built-in
+from pathlib import Path
+from threading import Thread
+from typing import Any
+
+# third-party
+from pytest import MonkeyPatch, mark, raises
+from vcorelib.io import ARBITER
+
+# module under test
+from ifgen import PKG_NAME
+from ifgen.client import UNIX_SOCKETS, send_request
+from ifgen.commands import client as client_cmd
+from ifgen.commands.impl import serve as serve_cmd
+from ifgen.entry import main as ifgen_main
+from ifgen.server import GenerationServer
+
+# internal
+from tests.resources import copy_scenario
+
+
+@mark.skipif(not UNIX_SOCKETS, reason="Unix sockets aren't available.")
+def test_serve_command_basic(tmp_path: Path):
+    """Test generating outputs with a server."""
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+    output = path.joinpath("src", "generated")
+    sock = tmp_path.joinpath("server.sock")
+    client = [PKG_NAME, "client", "-s", str(sock), "-r", str(path)]
+
+    # Without a server, outputs are generated in-process (unless disabled).
+    assert ifgen_main(client + ["--no-fallback"]) == 1
+    assert ifgen_main(client) == 0
+    outputs = {x: x.stat().st_mtime_ns for x in output.rglob("*.*")}
+    assert outputs
+
+    server = GenerationServer(sock)
+    thread = Thread(target=server.serve)
+    thread.start()
+
+    try:
+        # Another server can't use the same socket.
+        with raises(AssertionError):
+            ifgen_main([PKG_NAME, "serve", "-s", str(sock)])
+
+        # Nothing changed, so nothing should be re-written (or re-loaded).
+        assert ifgen_main(client) == 0
+        project = next(iter(server.projects.values()))
+        env = project.env
+        assert ifgen_main(client) == 0
+        assert project.env is env and len(server.projects) == 1
+        assert outputs == {
+            x: x.stat().st_mtime_ns for x in output.rglob("*.*")
+        }
+
+        # Remove a struct, its outputs should be removed.
+        config = path.joinpath("ifgen.yaml")
+        data: dict[str, Any] = ARBITER.decode(
+            config, require_success=True
+        ).data
+        del data["structs"]["TestPadding"]
+        ARBITER.encode(config, data)
+
+        assert ifgen_main(client) == 0
+        assert project.env is not env
+        assert not output.joinpath("structs", "TestPadding.h").exists()
+        assert output.joinpath("structs", "Test1.h").is_file()
+
+        # Invalid configurations fail requests, but not the server.
+        invalid: dict[str, Any] = {"structs": {"A": {"fields": [{}]}}}
+        ARBITER.encode(config, invalid)
+        assert ifgen_main(client) == 1
+        ARBITER.encode(config, data)
+        assert ifgen_main(client + ["-f", "-j", "2"]) == 0
+
+        # Requests can be profiled (by the server).
+        report = tmp_path.joinpath("profile.json")
+        stats = tmp_path.joinpath("profile.prof")
+        assert (
+            ifgen_main(
+                client + ["--profile", str(report), "--cprofile", str(stats)]
+            )
+            == 0
+        )
+        assert report.is_file() and stats.is_file()
+
+        # Mismatched versions are rejected.
+        response = send_request(sock, {"command": "gen"})
+        assert response["status"] == 1 and "error" in response
+
+    finally:
+        assert ifgen_main([PKG_NAME, "client", "-s", str(sock), "--stop"]) == 0
+        thread.join()
+        server.server_close()
+
+    assert not sock.exists()
+    assert ifgen_main([PKG_NAME, "client", "-s", str(sock), "--stop"]) == 1
+
+
+def test_client_without_unix_sockets(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Test the 'client' and 'serve' commands without Unix sockets."""
+
+    monkeypatch.setattr(client_cmd, "UNIX_SOCKETS", False)
+    monkeypatch.setattr(serve_cmd, "UNIX_SOCKETS", False)
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+    sock = tmp_path.joinpath("server.sock")
+    client = [PKG_NAME, "client", "-s", str(sock), "-r", str(path)]
+
+    # Outputs are always generated in-process.
+    assert ifgen_main(client) == 0
+    assert path.joinpath("src", "generated", "structs", "Test1.h").is_file()
+    assert ifgen_main(client + ["--no-fallback"]) == 1
+    assert ifgen_main([PKG_NAME, "client", "-s", str(sock), "--stop"]) == 1
+
+    assert ifgen_main([PKG_NAME, "serve", "-s", str(sock)]) == 1
+    assert not sock.exists()
+
+    # Arguments are validated like the 'gen' command's.
+    assert ifgen_main(client + ["-e", "threads"]) != 0
@@ -3,11 +3,25 @@ Test the 'commands.svd' module.
 """
 
 # built-in
+from multiprocessing import get_context
+from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
+
+# third-party
+from pytest import MonkeyPatch
+from vcorelib.io import ARBITER
+from vcorelib.paths import find_file
 
 # module under test
 from ifgen import PKG_NAME
+from ifgen.bench.synthetic import DEVICE_NAME, SyntheticSpec, write_synthetic
+from ifgen.commands.impl import svd
+from ifgen.config.svd import SvdConfig
 from ifgen.entry import main as ifgen_main
+from ifgen.svd import DEFAULT_SVD_CONFIG, register_processors
+from ifgen.svd.group import base, enums
+from ifgen.svd.task import SHARED_ENUMS_DIR, SvdProcessingTask
 
 
 def handle_proc(proc: str) -> None:
@@ -42,3 +56,204 @@ def test_svd_command_basic():
 
     for proc in ["mimxrt1176_cm7", "XMC4700", "rp2040"]:
         handle_proc(proc)
+
+
+def test_svd_stream(tmp_path: Path):
+    """Test that streaming and non-streaming SVD processing are equivalent."""
+
+    register_processors()
+
+    path = write_synthetic(SyntheticSpec(derived=5), tmp_path, config=False)[0]
+
+    streamed = SvdProcessingTask.svd(path, 2)
+    parsed = SvdProcessingTask.svd(path, 2, stream=False)
+
+    assert sorted(streamed.model.peripherals) == sorted(
+        parsed.model.peripherals
+    )
+    assert streamed.model.metadata() == parsed.model.metadata()
+
+
+def test_svd_backends(tmp_path: Path):
+    """Test that all XML-parsing backends produce the same outputs."""
+
+    register_processors()
+
+    path = write_synthetic(SyntheticSpec(derived=5), tmp_path, config=False)[0]
+
+    outputs = {}
+    for backend in ["xml", "lxml"]:
+        output = tmp_path.joinpath(backend)
+        SvdProcessingTask.svd(path, 2, backend=backend).generate_configs(
+            output, SvdConfig.decode(find_file(DEFAULT_SVD_CONFIG))
+        )
+        outputs[backend] = {
+            str(x.relative_to(output)): x.read_bytes()
+            for x in output.rglob("*")
+            if x.is_file()
+        }
+
+    assert outputs["xml"] == outputs["lxml"]
+
+
+def test_svd_jobs(tmp_path: Path):
+    """Test that parallel output encoding produces the same outputs."""
+
+    register_processors()
+
+    path = write_synthetic(
+        SyntheticSpec(peripherals=4, derived=2), tmp_path, config=False
+    )[0]
+    task = SvdProcessingTask.svd(path, 2)
+    config = SvdConfig.decode(find_file(DEFAULT_SVD_CONFIG))
+
+    outputs = {}
+    for jobs in [1, 2]:
+        output = tmp_path.joinpath(str(jobs))
+        task.generate_configs(output, config, jobs=jobs)
+        outputs[jobs] = {
+            str(x.relative_to(output)): x.read_bytes()
+            for x in output.rglob("*")
+            if x.is_file()
+        }
+
+    assert outputs[1] == outputs[2]
+
+
+def test_svd_share_enums(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Test emitting enumerations once for an entire device."""
+
+    # Restore module state (set from the configuration) after the test.
+    monkeypatch.setattr(enums, "SHARE_ENUMS", False)
+    monkeypatch.setattr(enums, "PRUNE_ENUMS", False)
+    monkeypatch.setattr(base, "PRUNE_STRUCTS", False)
+
+    path = write_synthetic(
+        SyntheticSpec(peripherals=2, derived=0), tmp_path, config=False
+    )[0]
+
+    config = tmp_path.joinpath("config.yaml")
+    ARBITER.encode(config, {"share_enums": [DEVICE_NAME]})
+
+    output = tmp_path.joinpath("output")
+    assert (
+        ifgen_main(
+            [PKG_NAME, "svd", "-c", str(config), "-o", str(output), str(path)]
+        )
+        == 0
+    )
+
+    # Peripheral includes only declare structs.
+    for name in ["p0", "p1"]:
+        data = ARBITER.decode(output.joinpath(name, "include.yaml")).data
+        assert "enums" not in data
+
+    shared: dict[str, Any] = ARBITER.decode(
+        output.joinpath(SHARED_ENUMS_DIR, "include.yaml")
+    ).data
+    assert list(shared["enums"]) == ["P0_R0_F0"]
+
+    assert ifgen_main([PKG_NAME, "-C", str(output), "gen"]) == 0
+    assert output.joinpath("src", "generated", "enums", "P0_R0_F0.h").is_file()
+
+
+def test_svd_command_batch(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Test processing multiple SVD files with one command."""
+
+    path = write_synthetic(SyntheticSpec(), tmp_path, config=False)[0]
+    for name in ["a", "b"]:
+        tmp_path.joinpath(f"{name}.svd").write_bytes(path.read_bytes())
+    path.unlink()
+
+    output = tmp_path.joinpath("output")
+    report = tmp_path.joinpath("report.json")
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "svd",
+                "-j",
+                "2",
+                "--report",
+                str(report),
+                "-o",
+                str(output),
+                str(tmp_path.joinpath("*.svd")),
+            ]
+        )
+        == 0
+    )
+
+    data: dict[str, Any] = ARBITER.decode(report).data
+    assert [Path(x["output"]).name for x in data["results"]] == ["a", "b"]
+
+    for name in ["a", "b"]:
+        assert output.joinpath(name, f"{PKG_NAME}.yaml").is_file()
+
+    # A pattern that matches a single file still uses a per-file directory.
+    output = tmp_path.joinpath("pattern")
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "svd",
+                "-o",
+                str(output),
+                str(tmp_path.joinpath("a.sv[d]")),
+            ]
+        )
+        == 0
+    )
+    assert output.joinpath("a", f"{PKG_NAME}.yaml").is_file()
+    assert not output.joinpath(f"{PKG_NAME}.yaml").exists()
+
+    # Workers started with 'spawn' (the default on some platforms) don't
+    # inherit any module state (files must be processed, not loaded from
+    # the cache).
+    monkeypatch.setattr(svd, "Pool", get_context("spawn").Pool)
+    output = tmp_path.joinpath("spawn")
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "svd",
+                "--no-cache",
+                "-j",
+                "2",
+                "-o",
+                str(output),
+                str(tmp_path.joinpath("*.svd")),
+            ]
+        )
+        == 0
+    )
+    for name in ["a", "b"]:
+        assert output.joinpath(name, f"{PKG_NAME}.yaml").is_file()
+
+
+def test_svd_command_generate(tmp_path: Path):
+    """Test generating code without writing configuration files."""
+
+    path = write_synthetic(SyntheticSpec(), tmp_path, config=False)[0]
+
+    configs = tmp_path.joinpath("configs")
+    assert ifgen_main([PKG_NAME, "svd", "-o", str(configs), str(path)]) == 0
+    assert ifgen_main([PKG_NAME, "-C", str(configs), "gen"]) == 0
+
+    direct = tmp_path.joinpath("direct")
+    assert (
+        ifgen_main([PKG_NAME, "svd", "-g", "-o", str(direct), str(path)]) == 0
+    )
+    assert not direct.joinpath(f"{PKG_NAME}.yaml").exists()
+
+    sources = {}
+    for output in [configs, direct]:
+        src = output.joinpath("src")
+        sources[output.name] = {
+            str(x.relative_to(src)): x.read_bytes()
+            for x in src.rglob("*")
+            if x.is_file()
+        }
+
+    assert sources["configs"]
+    assert sources["configs"] == sources["direct"]
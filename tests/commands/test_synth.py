@@ -0,0 +1,49 @@
+"""
+Test the 'commands.synth' module.
+"""
+
+# built-in
+from pathlib import Path
+
+# module under test
+from ifgen import PKG_NAME
+from ifgen.bench.synthetic import DEVICE_NAME
+from ifgen.entry import main as ifgen_main
+
+
+def test_synth_command_basic(tmp_path: Path):
+    """Test the 'synth' command."""
+
+    svd_dir = tmp_path.joinpath("svd")
+    config_dir = tmp_path.joinpath("config")
+
+    args = [PKG_NAME, "synth", "--peripherals", "2", "--derived", "3"]
+    assert ifgen_main(args + ["-o", str(svd_dir), "--no-config"]) == 0
+    assert (
+        ifgen_main(args + ["-o", str(config_dir), "--no-svd", "--json"]) == 0
+    )
+
+    # Generate code from the SVD file.
+    svd_out = tmp_path.joinpath("svd-out")
+    assert (
+        ifgen_main(
+            [
+                PKG_NAME,
+                "svd",
+                "-o",
+                str(svd_out),
+                str(svd_dir.joinpath(f"{DEVICE_NAME}.svd")),
+            ]
+        )
+        == 0
+    )
+    assert ifgen_main([PKG_NAME, "-C", str(svd_out), "gen"]) == 0
+
+    # Generate code from the configuration.
+    assert (
+        ifgen_main(
+            [PKG_NAME, "-C", str(config_dir), "gen", "-c", f"{PKG_NAME}.json"]
+        )
+        == 0
+    )
+    assert config_dir.joinpath("src", "generated", "structs", "P0.h").is_file()
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for tests.
+"""
+
+# built-in
+from pathlib import Path
+
+# third-party
+from pytest import MonkeyPatch, fixture
+
+# internal
+from ifgen.paths import CACHE_ENV
+
+
+@fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Don't use (or populate) the user's cache directory."""
+
+    result = tmp_path.joinpath("cache")
+    monkeypatch.setenv(CACHE_ENV, str(result))
+    return result
@@ -0,0 +1,58 @@
+"""
+Test the 'environment' module.
+"""
+
+# built-in
+from pathlib import Path
+
+# third-party
+from pytest import raises
+
+# module under test
+from ifgen.environment import Generator
+from ifgen.generation import create_task
+
+# internal
+from tests.resources import environment
+
+
+def test_environment_namespaces(tmp_path: Path):
+    """Test that instance namespaces are resolved once, up front."""
+
+    env = environment(
+        tmp_path,
+        {
+            "namespace": ["A"],
+            "structs": {
+                "S1": {
+                    "namespace": ["B"],
+                    "fields": [{"name": "a", "type": "uint8_t"}],
+                },
+                "S2": {"fields": [{"name": "a", "type": "uint8_t"}]},
+            },
+            "enums": {
+                "E": {"namespace": ["B", "C"], "enum": {"X": {}, "Y": {}}}
+            },
+        },
+    )
+
+    assert dict(env.namespaces) == {
+        (): "A",
+        ("B",): "A::B",
+        ("B", "C"): "A::B::C",
+    }
+
+    # The table is read-only.
+    with raises(TypeError):
+        env.namespaces[("D",)] = "A::D"  # type: ignore
+
+    # Looking up namespaces doesn't modify the type system's namespace.
+    stack = list(env.types.root_namespace.stack)
+
+    assert create_task(env, Generator.STRUCTS, "S1").namespace() == "A::B"
+    assert create_task(env, Generator.STRUCTS, "S2").namespace("X") == "A::X"
+    assert (
+        create_task(env, Generator.ENUMS, "E").namespace("X") == "A::B::C::X"
+    )
+
+    assert list(env.types.root_namespace.stack) == stack
@@ -0,0 +1,86 @@
+"""
+Test the 'environment.index' module.
+"""
+
+# built-in
+from pathlib import Path
+
+# third-party
+from pytest import raises
+
+# module under test
+from ifgen.environment import Generator
+from ifgen.environment.layout import TypeKind
+from ifgen.generation import create_task
+
+# internal
+from tests.resources import environment
+
+
+def test_type_index(tmp_path: Path):
+    """Test looking up types without querying the type system."""
+
+    env = environment(
+        tmp_path,
+        {
+            "namespace": ["A"],
+            "structs": {
+                "S": {
+                    "namespace": ["B"],
+                    "fields": [
+                        {"name": "a", "type": "uint16_t"},
+                        {"name": "e", "type": "E"},
+                    ],
+                },
+            },
+            "enums": {
+                "E": {
+                    "namespace": ["B"],
+                    "underlying": "uint8_t",
+                    "enum": {"X": {}, "Y": {}},
+                }
+            },
+        },
+    )
+    index = env.index
+
+    # Custom types are found by their final name.
+    struct = index["A::B::S"]
+    assert index["S"] == struct
+    assert struct.kind is TypeKind.STRUCT
+    assert struct.generator is Generator.STRUCTS
+    assert struct.size == 3
+    assert struct.primitive is None
+    assert struct.include == Path("structs", "S.h")
+
+    enum = index["E"]
+    assert enum.kind is TypeKind.ENUM
+    assert enum.generator is Generator.ENUMS
+    assert enum.size == 1
+    assert enum.primitive == "uint8"
+    assert set(index.enums) == {"E"}
+    assert env.get_enum("B::E") is index.enums["E"]
+
+    # Primitives are indexed too.
+    primitive = index["uint16_t"]
+    assert primitive.kind is TypeKind.PRIMITIVE
+    assert primitive.generator is None
+    assert primitive.size == 2
+
+    assert index.get("Unknown") is None
+    with raises(AssertionError):
+        index["Unknown"]  # pylint: disable=pointless-statement
+
+    assert env.is_struct("S") and not env.is_enum("S")
+    assert env.is_enum("E") and not env.is_struct("E")
+    assert not env.is_struct("uint16_t") and not env.is_enum("uint16_t")
+    assert env.size("E") == 1 and env.size("S") == 3
+
+    # Generators read custom-type information from the index.
+    task = create_task(env, Generator.STRUCTS, "S")
+    lookup = task.check_custom_type("E")
+    assert lookup is not None and lookup.generator is Generator.ENUMS
+    assert task.check_custom_type("uint16_t") is None
+    assert task.custom_include("E") == Path("..", "enums", "E.h")
+    assert task.custom_include("S") == Path("S.h")
+    assert task.custom_include("uint16_t") is None
@@ -0,0 +1,110 @@
+"""
+Test the 'environment.layout' module.
+"""
+
+# built-in
+from pathlib import Path
+
+# third-party
+from pytest import raises
+
+# module under test
+from ifgen.environment import Generator
+from ifgen.environment.layout import TypeKind
+from ifgen.generation import create_task
+
+# internal
+from tests.resources import environment
+
+
+def test_struct_layouts(tmp_path: Path):
+    """Test that struct layouts (including padding) match the type system."""
+
+    env = environment(
+        tmp_path,
+        {
+            "structs": {
+                "Inner": {
+                    "fields": [
+                        {"name": "a", "type": "uint16_t"},
+                        {"name": "b", "type": "uint8_t", "array_length": 3},
+                    ]
+                },
+                "Outer": {
+                    "fields": [
+                        {"name": "a", "type": "uint8_t"},
+                        {
+                            "name": "b",
+                            "type": "uint32_t",
+                            "expected_offset": 4,
+                        },
+                        {"name": "e", "type": "E"},
+                        {"name": "inner", "type": "Inner"},
+                        {"name": "c", "type": "float", "expected_offset": 16},
+                    ]
+                },
+            },
+            "enums": {"E": {"enum": {"X": {}, "Y": {}}}},
+        },
+    )
+
+    inner = env.index.layouts["Inner"]
+    assert inner.size == 5
+    assert [(x.name, x.offset, x.size) for x in inner.fields.values()] == [
+        ("a", 0, 2),
+        ("b", 2, 3),
+    ]
+    assert inner.fields["b"].element_size == 1
+    assert inner.fields["b"].array_length == 3
+
+    outer = env.index.layouts["Outer"]
+    fields = list(outer.fields.values())
+
+    # Padding is inserted (before fields with an expected offset) where
+    # necessary.
+    assert [x.name for x in fields if x.padding] == [
+        "reserved_padding0",
+        "reserved_padding1",
+    ]
+    assert [(x.name, x.offset, x.size, x.kind) for x in fields] == [
+        ("a", 0, 1, TypeKind.PRIMITIVE),
+        ("reserved_padding0", 1, 3, TypeKind.PRIMITIVE),
+        ("b", 4, 4, TypeKind.PRIMITIVE),
+        ("e", 8, 1, TypeKind.ENUM),
+        ("inner", 9, 5, TypeKind.STRUCT),
+        ("reserved_padding1", 14, 2, TypeKind.PRIMITIVE),
+        ("c", 16, 4, TypeKind.PRIMITIVE),
+    ]
+
+    # Layouts agree with the type system.
+    assert outer.size == 20 == env.types.size("Outer")
+    assert inner.size == env.types.size("Inner")
+
+    # Padding fields are part of the struct's configuration.
+    data = env.config.data["structs"]["Outer"]["fields"]
+    assert [x["name"] for x in data] == [x.name for x in fields]
+
+    assert create_task(env, Generator.STRUCTS, "Outer").layout is outer
+
+
+def test_struct_layouts_invalid_offset(tmp_path: Path):
+    """Test that an expected offset behind the current offset is rejected."""
+
+    with raises(AssertionError):
+        environment(
+            tmp_path,
+            {
+                "structs": {
+                    "S": {
+                        "fields": [
+                            {"name": "a", "type": "uint32_t"},
+                            {
+                                "name": "b",
+                                "type": "uint8_t",
+                                "expected_offset": 2,
+                            },
+                        ]
+                    }
+                }
+            },
+        )
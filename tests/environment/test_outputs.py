@@ -0,0 +1,33 @@
+"""
+Test the 'environment.outputs' module.
+"""
+
+# built-in
+import os
+from pathlib import Path
+
+# module under test
+from ifgen.environment.outputs import write_if_changed
+
+
+def test_write_if_changed(tmp_path: Path):
+    """Test that files are only written when their contents change."""
+
+    path = tmp_path.joinpath("a", "b.h")
+    assert write_if_changed(path, "a")
+    assert not write_if_changed(path, "a")
+    assert path.read_text() == "a"
+
+    # New files get the same mode as a plain write.
+    plain = tmp_path.joinpath("plain.h")
+    plain.write_text("a")
+    assert path.stat().st_mode == plain.stat().st_mode
+
+    # Existing files keep their mode.
+    os.chmod(path, 0o640)
+    assert write_if_changed(path, "b")
+    assert path.read_text() == "b"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+    # No temporary files are left behind.
+    assert {x.name for x in path.parent.iterdir()} == {"b.h"}
@@ -0,0 +1,175 @@
+"""
+Test the 'generation' module.
+"""
+
+# built-in
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+# third-party
+from pytest import raises
+from vcorelib.io import ARBITER
+
+# module under test
+from ifgen.config import load
+from ifgen.environment import Generator, IfgenEnvironment
+from ifgen.generation import (
+    WorkItem,
+    create_task,
+    generate,
+    generate_environment,
+    run_items,
+)
+from ifgen.generation.interface import GenerateTask
+
+# internal
+from tests.resources import copy_scenario
+
+
+def read_outputs(path: Path) -> dict[str, bytes]:
+    """Read a scenario's generated outputs."""
+
+    output = path.joinpath("src", "generated")
+    return {
+        str(x.relative_to(output)): x.read_bytes()
+        for x in output.rglob("*")
+        if x.is_file()
+    }
+
+
+def sample_outputs(tmp_path: Path, name: str, **kwargs) -> dict[str, bytes]:
+    """Generate the sample scenario (in a copy) and return its outputs."""
+
+    path = copy_scenario("sample", tmp_path.joinpath(name))
+    generate(path, load(path.joinpath("ifgen.yaml"), cache=False), **kwargs)
+    return read_outputs(path)
+
+
+def test_generate_jobs(tmp_path: Path):
+    """Test that outputs don't depend on the number of jobs."""
+
+    outputs = sample_outputs(tmp_path, "serial", jobs=1)
+    assert outputs
+    assert sample_outputs(tmp_path, "threads", jobs=4) == outputs
+
+
+def test_run_items(tmp_path: Path):
+    """Test that every work item runs exactly once (in order, serially)."""
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+    env = IfgenEnvironment(
+        path, load(path.joinpath("ifgen.yaml"), cache=False)
+    )
+    tasks = [
+        create_task(env, generator, name)
+        for generator in Generator
+        for name in env.config.data.get(generator.value, {})
+    ]
+    assert len(tasks) > 1
+
+    calls: list[tuple[str, str]] = []
+    lock = Lock()
+
+    def first(task: GenerateTask) -> None:
+        """A generation method that records its calls."""
+        with lock:
+            calls.append(("first", task.key))
+
+    def second(task: GenerateTask) -> None:
+        """A generation method that records its calls."""
+        with lock:
+            calls.append(("second", task.key))
+
+    items: list[WorkItem] = [
+        (method, task) for method in [first, second] for task in tasks
+    ]
+    expected = [(method.__name__, task.key) for method, task in items]
+
+    run_items(items, jobs=1)
+    assert calls == expected
+
+    for jobs in [2, 3, 8]:
+        calls.clear()
+        run_items(items, jobs=jobs)
+        assert sorted(calls) == sorted(expected)
+
+    with raises(AssertionError):
+        run_items(items, executor="threads")
+
+
+def test_generate_process(tmp_path: Path):
+    """Test generating outputs in worker processes."""
+
+    outputs = sample_outputs(tmp_path, "threads", jobs=2)
+    assert (
+        sample_outputs(tmp_path, "processes", jobs=2, executor="process")
+        == outputs
+    )
+
+    # Files written by workers are tracked by the parent.
+    path = tmp_path.joinpath("processes")
+    counts = []
+    for executor in ["thread", "process"]:
+        env = IfgenEnvironment(
+            path, load(path.joinpath("ifgen.yaml"), cache=False)
+        )
+        generate_environment(env, force=True, jobs=2, executor=executor)
+        counts.append(env.outputs.counts)
+
+    assert counts[0] == counts[1]
+    assert counts[0]["unchanged"] > len(outputs)
+    assert counts[0]["written"] == 0
+
+
+def test_generate_incremental(tmp_path: Path):
+    """
+    Test that editing a type re-generates everything that depends on it (the
+    same outputs as a full build).
+    """
+
+    path = copy_scenario("sample", tmp_path.joinpath("sample"))
+    config = path.joinpath("ifgen.yaml")
+    generate(path, load(config), jobs=1)
+
+    def edit(change: Callable[[dict[str, Any]], None]) -> set[str]:
+        """Edit the configuration and return which outputs changed."""
+
+        before = read_outputs(path)
+
+        data: dict[str, Any] = ARBITER.decode(
+            config, require_success=True
+        ).data
+        change(data)
+        ARBITER.encode(config, data)
+
+        generate(path, load(config), jobs=1)
+        outputs = read_outputs(path)
+
+        generate(path, load(config), force=True, jobs=1)
+        assert read_outputs(path) == outputs
+
+        return {x for x, value in outputs.items() if before.get(x) != value}
+
+    # An enumeration used by a struct (through a bit-field).
+    changed = edit(
+        lambda data: data["enums"]["Enum2"]["enum"].update({"yellow": None})
+    )
+    assert {"enums/Enum2.h", "structs/Test3.h"} <= changed
+
+    # A struct used as a field.
+    changed = edit(
+        lambda data: data["structs"]["Test2"]["fields"][0].update(
+            {"type": "int32_t"}
+        )
+    )
+    assert {"structs/Test2.h", "structs/Test3.h"} <= changed
+
+    # An unrelated enumeration (JSON data includes every enumeration).
+    changed = edit(
+        lambda data: data["enums"].update(
+            {"BrandNewEnum": {"enum": {"a": None, "b": None}}}
+        )
+    )
+    assert {"enums/BrandNewEnum.h", "structs/Test2.h"} <= changed
+    assert "structs/Test6.h" not in changed
@@ -4,7 +4,12 @@ A module for working with test data.
 
 # built-in
 from pathlib import Path
-from shutil import rmtree
+from shutil import copytree, ignore_patterns, rmtree
+from typing import Any
+
+# internal
+from ifgen.config import from_data
+from ifgen.environment import IfgenEnvironment
 
 
 def resource(resource_name: str, *parts: str, valid: bool = True) -> Path:
@@ -25,7 +30,28 @@ def clean_scenario(name: str) -> Path:
 
     # Clean things that can affect tests.
     src = Path("src")
-    for path in [src.joinpath("generated"), src.joinpath("apps", "generated")]:
+    for path in [
+        src.joinpath("generated"),
+        src.joinpath("apps", "generated"),
+        Path(".ifgen-cache"),
+    ]:
         rmtree(base.joinpath(path), ignore_errors=True)
 
     return base
+
+
+def copy_scenario(name: str, destination: Path) -> Path:
+    """Copy a scenario directory (without generated outputs)."""
+
+    copytree(
+        clean_scenario(name),
+        destination,
+        symlinks=True,
+        ignore=ignore_patterns("generated"),
+    )
+    return destination
+
+
+def environment(root: Path, data: dict[str, Any]) -> IfgenEnvironment:
+    """Create an environment from configuration data."""
+    return IfgenEnvironment(root, from_data(data))
@@ -0,0 +1,55 @@
+"""
+Test the 'svd.cache' module.
+"""
+
+# built-in
+import os
+from pathlib import Path
+
+# module under test
+from ifgen.bench.synthetic import SyntheticSpec, write_synthetic
+from ifgen.svd import register_processors
+from ifgen.svd.cache import SUFFIX, cached_svd, evict, model_key
+
+
+def test_cached_svd(tmp_path: Path, cache_dir: Path) -> None:
+    """Test loading processed models from the cache."""
+
+    register_processors()
+
+    path = write_synthetic(SyntheticSpec(derived=2), tmp_path, config=False)[0]
+
+    task = cached_svd(path, 2)
+    entry = cache_dir.joinpath("svd", model_key(path, 2) + SUFFIX)
+    assert entry.is_file()
+
+    cached = cached_svd(path, 2)
+    assert cached.model is not task.model
+    assert cached.model.metadata() == task.model.metadata()
+    assert list(cached.model.peripherals) == list(task.model.peripherals)
+
+    # Different settings use different entries.
+    assert model_key(path, 3) != model_key(path, 2)
+
+    # Entries that can't be loaded are discarded (and replaced).
+    entry.write_bytes(b"garbage")
+    assert cached_svd(path, 2).model.metadata() == task.model.metadata()
+    assert entry.read_bytes() != b"garbage"
+
+
+def test_evict(tmp_path: Path) -> None:
+    """Test that least-recently used entries are evicted first."""
+
+    for idx, name in enumerate(["a", "b", "c"]):
+        entry = tmp_path.joinpath(name + SUFFIX)
+        entry.write_bytes(bytes(10))
+        os.utime(entry, (idx, idx))
+
+    # Using an entry makes it the most recent.
+    os.utime(tmp_path.joinpath("a" + SUFFIX), (10, 10))
+
+    assert evict(tmp_path, 20) == [tmp_path.joinpath("b" + SUFFIX)]
+    assert sorted(x.name for x in tmp_path.iterdir()) == [
+        "a" + SUFFIX,
+        "c" + SUFFIX,
+    ]
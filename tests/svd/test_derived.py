@@ -0,0 +1,55 @@
+"""
+Test the 'svd.model.derived' module.
+"""
+
+# built-in
+from xml.etree import ElementTree
+
+# third-party
+from pytest import raises
+
+# module under test
+from ifgen.svd.model.derived import derived_from_stack, derived_order
+
+
+def elements(*pairs: tuple[str, str]) -> list[ElementTree.Element]:
+    """Create elements from (name, derivedFrom) pairs."""
+
+    result = []
+    for name, derived in pairs:
+        elem = ElementTree.Element("peripheral")
+        if derived:
+            elem.set("derivedFrom", derived)
+        ElementTree.SubElement(elem, "name").text = name
+        result.append(elem)
+
+    return result
+
+
+def names(elems: list[ElementTree.Element]) -> list[str]:
+    """Get element names."""
+    return [x.findtext("name", "") for x in elems]
+
+
+def test_derived_order_basic():
+    """Test ordering elements derived from other derived elements."""
+
+    elems = elements(("C", "B"), ("A", ""), ("D", "C"), ("B", "A"), ("E", ""))
+    assert names(derived_order(elems)) == ["A", "B", "C", "D", "E"]
+
+    # Bases can already be known.
+    assert names(derived_order(elements(("B", "A")), known={"A"})) == ["B"]
+
+    # Elements that aren't derived come first (in reverse order).
+    elems = elements(("A", ""), ("C", "B"), ("B", "A"), ("D", ""))
+    assert names(derived_from_stack(elems)) == ["D", "A", "B", "C"]
+
+
+def test_derived_order_errors():
+    """Test that unresolvable references are reported."""
+
+    with raises(AssertionError, match="'B' derived from unknown 'X'"):
+        derived_order(elements(("A", ""), ("B", "X")))
+
+    with raises(AssertionError, match="'B' -> 'C' -> 'B'"):
+        derived_order(elements(("A", "B"), ("B", "C"), ("C", "B")))
@@ -0,0 +1,45 @@
+"""
+Test the 'svd.group.base' module.
+"""
+
+# built-in
+from pathlib import Path
+
+# third-party
+from pytest import MonkeyPatch
+
+# module under test
+from ifgen.bench.synthetic import SyntheticSpec, synthetic_svd
+from ifgen.svd import register_processors
+from ifgen.svd.group import base
+from ifgen.svd.task import SvdProcessingTask
+
+
+def test_peripheral_groups_pruning(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that equivalent peripherals are grouped when pruning."""
+
+    register_processors()
+    monkeypatch.setattr(base, "PRUNE_STRUCTS", True)
+
+    tree = synthetic_svd(SyntheticSpec(peripherals=4, derived=0))
+
+    # Make one peripheral a strict prefix of the others (it shouldn't be
+    # considered equivalent).
+    root = tree.getroot()
+    assert root is not None
+    registers = root.findall("./peripherals/peripheral/registers")
+    registers[-1].remove(registers[-1][-1])
+
+    path = tmp_path.joinpath("device.svd")
+    tree.write(path)
+
+    peripherals = SvdProcessingTask.svd(path, 2).model.peripherals
+    assert len(peripherals) == 4
+
+    groups = base.peripheral_groups(peripherals)
+    assert sorted(len(list(x.peripherals)) for x in groups.values()) == [
+        1,
+        3,
+    ]
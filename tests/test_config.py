@@ -0,0 +1,89 @@
+"""
+Test the 'config' module.
+"""
+
+# built-in
+from pathlib import Path
+from typing import Any
+
+# third-party
+from vcorelib.io import ARBITER, DEFAULT_INCLUDES_KEY
+
+# module under test
+from ifgen import PKG_NAME
+from ifgen.config import config_cache, load
+from ifgen.config.includes import decode_includes
+from ifgen.entry import main as ifgen_main
+from ifgen.paths import CACHE_DIR
+
+
+def test_config_cache(tmp_path: Path, cache_dir: Path):
+    """Test that configurations are cached until a loaded file changes."""
+
+    path = tmp_path.joinpath(f"{PKG_NAME}.yaml")
+    include = tmp_path.joinpath("include.yaml")
+    ARBITER.encode(path, {"includes": ["include.yaml"]})
+    ARBITER.encode(include, {"namespace": ["A"]})
+
+    # Entries are kept in the user's cache directory.
+    entry = config_cache(path.resolve())
+    assert entry.is_relative_to(cache_dir)
+
+    # Configurations aren't cached by default.
+    assert load(path).data["namespace"] == ["A"]
+    assert not entry.exists()
+
+    assert load(path, cache=True).data["namespace"] == ["A"]
+    assert entry.is_file()
+    assert load(path, cache=True).data["namespace"] == ["A"]
+    assert not tmp_path.joinpath(CACHE_DIR).exists()
+
+    # Changing an included file should invalidate the entry.
+    ARBITER.encode(include, {"namespace": ["B"]})
+    assert load(path, cache=True).data["namespace"] == ["B"]
+
+    # Unusable entries should be discarded.
+    entry.write_bytes(b"garbage")
+    assert load(path, cache=True).data["namespace"] == ["B"]
+
+    assert (
+        ifgen_main([PKG_NAME, "gen", "-r", str(tmp_path), "--no-config-cache"])
+        == 0
+    )
+
+
+def test_decode_includes(tmp_path: Path):
+    """Test that includes decoded in parallel are merged like the arbiter."""
+
+    path = tmp_path.joinpath(f"{PKG_NAME}.yaml")
+    ARBITER.encode(
+        path,
+        {
+            "includes": ["a.yaml", "b.yaml"],
+            "includes_left": ["c.yaml"],
+            "value": 0,
+        },
+    )
+    ARBITER.encode(
+        tmp_path.joinpath("a.yaml"),
+        {"includes": ["nested/d.yaml"], "list": [1], "value": 1},
+    )
+    ARBITER.encode(tmp_path.joinpath("b.yaml"), {"list": [2], "b": 2})
+    ARBITER.encode(tmp_path.joinpath("c.yaml"), {"list": [3], "value": 3})
+    tmp_path.joinpath("nested").mkdir()
+    ARBITER.encode(tmp_path.joinpath("nested", "d.yaml"), {"d": 4})
+
+    expected: list[Any] = []
+    data = ARBITER.decode(
+        path,
+        includes_key=DEFAULT_INCLUDES_KEY,
+        require_success=True,
+        files_loaded=expected,
+    ).data
+
+    for jobs in [1, 2]:
+        files: list[Any] = []
+        result = decode_includes(path, jobs=jobs, files_loaded=files)
+        assert result == data
+        assert list(result) == list(data)
+        assert files == expected
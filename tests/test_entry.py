@@ -26,3 +26,40 @@ def test_package_entry():
     """Test the command-line entry through the 'python -m' invocation."""
 
     check_output([executable, "-m", "ifgen", "-h"])
+
+
+def test_entry_imports():
+    """
+    Test that importing the entry-point (and running a command) doesn't
+    import every command's implementation.
+    """
+
+    def imported(*args: str) -> set[str]:
+        """Get the modules imported by a command (in a new interpreter)."""
+
+        return set(
+            check_output(
+                [
+                    executable,
+                    "-c",
+                    f"import sys; from {PKG_NAME}.entry import main; "
+                    "main(sys.argv); print(*sys.modules, sep='\\n')",
+                    *args,
+                ],
+                text=True,
+            ).splitlines()
+        )
+
+    heavy = (
+        f"{PKG_NAME}.commands.impl.",
+        f"{PKG_NAME}.generation",
+        f"{PKG_NAME}.svd",
+        "runtimepy",
+    )
+
+    assert not [x for x in imported("noop") if x.startswith(heavy)]
+
+    # Only the requested command's implementation is imported.
+    modules = imported("gen", "-h")
+    assert f"{PKG_NAME}.commands.impl.gen" in modules
+    assert f"{PKG_NAME}.commands.impl.svd" not in modules
@@ -0,0 +1,88 @@
+"""
+Test the 'schemas' module.
+"""
+
+# built-in
+from pathlib import Path
+from typing import Any
+
+# third-party
+from fastjsonschema import JsonSchemaException
+from pytest import MonkeyPatch, raises
+from vcorelib.schemas.base import SchemaValidationError
+from vcorelib.schemas.json import package_handler
+
+# module under test
+from ifgen.paths import CACHE_ENV
+from ifgen.schemas import (
+    IfgenSchemaMap,
+    load_validator,
+    schemas_digest,
+    struct_handler,
+)
+
+
+def test_schema_map(cache_dir: Path):
+    """Test that package schemas are loaded from generated code."""
+
+    schemas = IfgenSchemaMap()
+    assert "Config" in schemas
+    assert "Unknown" not in schemas
+    with raises(KeyError):
+        assert schemas["Unknown"]
+
+    config = schemas["Config"]
+    assert cache_dir.joinpath(
+        "schemas", schemas_digest(), "Config_struct_handler.py"
+    ).is_file()
+
+    # Struct fields are validated separately, but should still get
+    # defaults and errors with their full path.
+    data = config(
+        {"structs": {"A": {"fields": [{"name": "a", "type": "uint8_t"}]}}}
+    )
+    assert data["structs"]["A"]["fields"][0]["padding"] is False
+
+    with raises(SchemaValidationError, match=r"data.structs.A.fields\[1\]"):
+        config(
+            {
+                "structs": {
+                    "A": {
+                        "fields": [
+                            {"name": "a", "type": "uint8_t"},
+                            {"name": "b"},
+                        ]
+                    }
+                }
+            }
+        )
+
+    # Generated code should be re-used.
+    assert IfgenSchemaMap()["Config"]({})["output_dir"] == ["generated"]
+
+
+def test_load_validator(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Test that validators compiled with different handlers are distinct."""
+
+    struct: dict[str, Any] = {"fields": [{}]}
+
+    # Try both orders (with an empty cache).
+    for index, handlers in enumerate(
+        [[package_handler, struct_handler], [struct_handler, package_handler]]
+    ):
+        monkeypatch.setenv(CACHE_ENV, str(tmp_path.joinpath(str(index))))
+
+        for handler in handlers:
+            validator = load_validator("Struct", handler=handler)
+            if handler is struct_handler:
+                assert validator(struct)
+            else:
+                with raises(JsonSchemaException):
+                    validator(struct)
+
+    # Validators are compiled in memory if the cache can't be written.
+    blocker = tmp_path.joinpath("file")
+    blocker.touch()
+    monkeypatch.setenv(CACHE_ENV, str(blocker.joinpath("cache")))
+    assert IfgenSchemaMap()["Config"]({})["output_dir"] == ["generated"]
+    assert not blocker.joinpath("cache").exists()